@@ -1,50 +1,92 @@
 from __future__ import annotations
 
+import hashlib
+import inspect
+import json
 import math
+import multiprocessing
+import os
+import sys
 from pathlib import Path
 
+import matplotlib
 import matplotlib.pyplot as plt
 import numpy as np
 
 
 OUT_DIR = Path("assets") / "simulations"
+CACHE_PATH = OUT_DIR / ".cache.json"
 
 
-def _base_style():
-    plt.rcParams.update(
-        {
-            "figure.facecolor": "#0b0f14",
-            "axes.facecolor": "#0b0f14",
-            "savefig.facecolor": "#0b0f14",
-            "text.color": "#EAF2FF",
-            "axes.labelcolor": "#EAF2FF",
-            "axes.edgecolor": "#2A3340",
-            "xtick.color": "#A8B3C7",
-            "ytick.color": "#A8B3C7",
-            "grid.color": "#2A3340",
-            "grid.alpha": 0.35,
-            "axes.grid": True,
-            "font.size": 12,
-            "axes.titleweight": "bold",
-        }
-    )
+def _polar_grid(n: int):
+    # float32 is plenty at thumbnail resolution and halves memory traffic
+    theta = np.linspace(0, 2 * np.pi, n, dtype=np.float32)
+    return theta, np.cos(theta), np.sin(theta)
+
+
+# Shared grids for every orbit/ground-track thumbnail; cos/sin are evaluated once.
+_THETA, _COS_T, _SIN_T = _polar_grid(720)
+_LON = np.linspace(-180, 180, 720, dtype=np.float32)
+
+
+_STYLE = {
+    "figure.facecolor": "#0b0f14",
+    "axes.facecolor": "#0b0f14",
+    "savefig.facecolor": "#0b0f14",
+    "text.color": "#EAF2FF",
+    "axes.labelcolor": "#EAF2FF",
+    "axes.edgecolor": "#2A3340",
+    "xtick.color": "#A8B3C7",
+    "ytick.color": "#A8B3C7",
+    "grid.color": "#2A3340",
+    "grid.alpha": 0.35,
+    "axes.grid": True,
+    "font.size": 12,
+    "axes.titleweight": "bold",
+}
+
+# Applied once at import, so every process that loads this module is already styled
+plt.rcParams.update(_STYLE)
 
 
 def _finish(fig: plt.Figure, title: str, subtitle: str, out_path: Path):
     fig.suptitle(title, x=0.03, y=0.98, ha="left", va="top", fontsize=18, color="#00D4FF")
     fig.text(0.03, 0.93, subtitle, ha="left", va="top", fontsize=12, color="#A8B3C7")
-    fig.tight_layout(rect=(0, 0, 1, 0.9))
+    # Fixed margins for the 12x6.75 canvas: no tight_layout/bbox_inches extra draw passes
+    fig.subplots_adjust(left=0.07, right=0.93, top=0.80, bottom=0.10)
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(out_path, dpi=160, bbox_inches="tight")
-    plt.close(fig)
+    # Flat dark backgrounds compress well at a low zlib level; the default (6) mostly costs time.
+    fig.savefig(out_path, dpi=160, pil_kwargs={"compress_level": 3, "optimize": False})
+    fig.clf()
+
+
+def _source_hash(fn) -> str:
+    # Shared style, helpers, module-level grids and the matplotlib version are part
+    # of every thumbnail's "source"
+    parts = [json.dumps(_STYLE, sort_keys=True), matplotlib.__version__]
+    parts += [inspect.getsource(f) for f in (_polar_grid, _view_matrix, _finish, fn)]
+    h = hashlib.blake2b("\n".join(parts).encode())
+    for grid in (_THETA, _COS_T, _SIN_T, _LON):
+        h.update(grid.tobytes())
+    return h.hexdigest()[:16]
 
 
-def thumb_rocket_ascent(out_path: Path):
+def _load_cache() -> dict:
+    try:
+        return json.loads(CACHE_PATH.read_text())
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def thumb_rocket_ascent(fig: plt.Figure, out_path: Path):
     t = np.linspace(0, 180, 240)
-    altitude_km = 120 * (1 - np.exp(-t / 55)) ** 1.35
-    v_ms = np.gradient(altitude_km * 1000, t)
+    exp_term = np.exp(-t / 55)
+    one_minus = 1 - exp_term
+    altitude_km = 120 * one_minus**1.35
+    # Analytic d/dt of the altitude profile (m/s)
+    v_ms = 120_000 * 1.35 * one_minus**0.35 * exp_term / 55
 
-    fig, ax = plt.subplots(figsize=(12, 6.75))
+    ax = fig.add_subplot(111)
     ax.plot(t, altitude_km, color="#00D4FF", lw=2.8)
     ax.fill_between(t, altitude_km, 0, color="#00D4FF", alpha=0.10)
     ax2 = ax.twinx()
@@ -62,19 +104,16 @@ def thumb_rocket_ascent(out_path: Path):
     _finish(fig, "Rocket Ascent Simulator", "Thrust, drag, gravity turn, and live telemetry", out_path)
 
 
-def thumb_conic_orbits(out_path: Path):
-    theta = np.linspace(0, 2 * np.pi, 720)
-
+def thumb_conic_orbits(fig: plt.Figure, out_path: Path):
     # Ellipse in polar form: r = p / (1 + e cos θ)
     p = 1.0
-    e1 = 0.25
-    e2 = 0.7
-    r1 = p / (1 + e1 * np.cos(theta))
-    r2 = p / (1 + e2 * np.cos(theta))
-
-    fig, ax = plt.subplots(figsize=(12, 6.75))
-    ax.plot(r1 * np.cos(theta), r1 * np.sin(theta), color="#00D4FF", lw=2.6, label=f"e={e1:.2f}")
-    ax.plot(r2 * np.cos(theta), r2 * np.sin(theta), color="#FF4D6D", lw=2.2, label=f"e={e2:.2f}")
+    ecc = np.array([0.25, 0.7], dtype=np.float32)
+    r = p / (1 + ecc[:, None] * _COS_T)  # (n_ecc, N) in one broadcast
+    xs, ys = r * _COS_T, r * _SIN_T
+
+    ax = fig.add_subplot(111)
+    for x, y, e, color, lw in zip(xs, ys, ecc, ("#00D4FF", "#FF4D6D"), (2.6, 2.2)):
+        ax.plot(x, y, color=color, lw=lw, label=f"e={e:.2f}")
     ax.scatter([0], [0], s=180, color="#EAF2FF", edgecolor="#0b0f14", zorder=5, label="Primary body")
     ax.set_aspect("equal", adjustable="box")
     ax.set_xlabel("x (normalized)")
@@ -87,13 +126,14 @@ def thumb_conic_orbits(out_path: Path):
     _finish(fig, "Conic Orbit Visualizer", "Circular, elliptical, parabolic, and hyperbolic trajectories", out_path)
 
 
-def thumb_constellation_propagator(out_path: Path):
+def thumb_constellation_propagator(fig: plt.Figure, out_path: Path):
     # Simple ground-track like curves (lat vs lon)
-    lon = np.linspace(-180, 180, 720)
-    lat1 = 45 * np.sin(np.deg2rad(lon * 1.2))
-    lat2 = 60 * np.sin(np.deg2rad(lon * 1.8 + 25))
+    lon = _LON
+    # Both planes share one vectorized sin over a stacked (2, N) phase array
+    phase = np.deg2rad(np.stack([lon * 1.2, lon * 1.8 + 25]))
+    lat1, lat2 = np.array([[45.0], [60.0]], dtype=np.float32) * np.sin(phase)
 
-    fig, ax = plt.subplots(figsize=(12, 6.75))
+    ax = fig.add_subplot(111)
     ax.plot(lon, lat1, color="#00D4FF", lw=2.4, label="Plane A (sample)")
     ax.plot(lon, lat2, color="#FCA311", lw=2.0, alpha=0.95, label="Plane B (sample)")
     ax.axhline(0, color="#2A3340", lw=1)
@@ -107,20 +147,24 @@ def thumb_constellation_propagator(out_path: Path):
     _finish(fig, "Satellite Constellation Propagator", "Orbit propagation, ground tracks, and coverage stats", out_path)
 
 
-def thumb_mars_mission(out_path: Path):
-    theta = np.linspace(0, 2 * np.pi, 720)
-
+def thumb_mars_mission(fig: plt.Figure, out_path: Path):
     # Two circular orbits + a transfer ellipse
     r_earth = 1.0
     r_mars = 1.524
     a = (r_earth + r_mars) / 2
     e = (r_mars - r_earth) / (r_mars + r_earth)
-    r_tr = a * (1 - e**2) / (1 + e * np.cos(theta))
-
-    fig, ax = plt.subplots(figsize=(12, 6.75))
-    ax.plot(r_earth * np.cos(theta), r_earth * np.sin(theta), color="#4ECDC4", lw=2.2, label="Earth orbit")
-    ax.plot(r_mars * np.cos(theta), r_mars * np.sin(theta), color="#FF4D6D", lw=2.2, label="Mars orbit")
-    ax.plot(r_tr * np.cos(theta), r_tr * np.sin(theta), color="#00D4FF", lw=2.8, label="Transfer (Hohmann)")
+    r_tr = a * (1 - e**2) / (1 + e * _COS_T)
+    r = np.stack(np.broadcast_arrays(r_earth, r_mars, r_tr), dtype=np.float32)  # (3, N)
+    xs, ys = r * _COS_T, r * _SIN_T
+
+    ax = fig.add_subplot(111)
+    styles = [
+        ("#4ECDC4", 2.2, "Earth orbit"),
+        ("#FF4D6D", 2.2, "Mars orbit"),
+        ("#00D4FF", 2.8, "Transfer (Hohmann)"),
+    ]
+    for x, y, (color, lw, label) in zip(xs, ys, styles):
+        ax.plot(x, y, color=color, lw=lw, label=label)
     ax.scatter([0], [0], s=220, color="#FFD166", edgecolor="#0b0f14", zorder=5, label="Sun")
     ax.set_aspect("equal", adjustable="box")
     ax.set_xlabel("x (AU)")
@@ -133,12 +177,12 @@ def thumb_mars_mission(out_path: Path):
     _finish(fig, "Mars Mission Simulator", "Transfer windows, transit, and EDL walkthrough", out_path)
 
 
-def thumb_trade_simulator(out_path: Path):
+def thumb_trade_simulator(fig: plt.Figure, out_path: Path):
     payload = np.array([150, 120, 95, 70])
     dv = np.array([9.4, 11.8, 12.5, 16.0])
     labels = ["LEO", "GTO", "Moon", "Mars"]
 
-    fig, ax = plt.subplots(figsize=(12, 6.75))
+    ax = fig.add_subplot(111)
     ax.bar(labels, payload, color="#00D4FF", alpha=0.85, edgecolor="#2A3340")
     ax.plot(labels, payload, color="#EAF2FF", lw=1.4, alpha=0.6)
     ax.set_ylabel("Payload (t) (illustrative)")
@@ -151,34 +195,51 @@ def thumb_trade_simulator(out_path: Path):
     _finish(fig, "Launch Vehicle Trade Simulator", "Mass ratio, Isp, payload, and mission targets", out_path)
 
 
-def thumb_constellation_designer(out_path: Path):
+def _view_matrix(elev_deg: float, azim_deg: float) -> np.ndarray:
+    """Rows: screen-right, screen-up, toward-viewer (matplotlib 3D view convention)."""
+    el, az = math.radians(elev_deg), math.radians(azim_deg)
+    return np.array(
+        [
+            [-math.sin(az), math.cos(az), 0.0],
+            [-math.sin(el) * math.cos(az), -math.sin(el) * math.sin(az), math.cos(el)],
+            [math.cos(el) * math.cos(az), math.cos(el) * math.sin(az), math.sin(el)],
+        ]
+    )
+
+
+def thumb_constellation_designer(fig: plt.Figure, out_path: Path):
     rng = np.random.default_rng(7)
     n = 220
     x = rng.normal(0, 1.0, n)
     y = rng.normal(0, 0.65, n)
     z = rng.normal(0, 0.4, n)
 
-    fig = plt.figure(figsize=(12, 6.75))
-    ax = fig.add_subplot(111, projection="3d")
-    ax.scatter(x, y, z, s=14, c="#00D4FF", alpha=0.9)
-    ax.scatter([0], [0], [0], s=260, c="#EAF2FF", edgecolors="#0b0f14")
+    # Static thumbnail: project once with matplotlib's default 3D view (elev=30, azim=-60)
+    # and draw a plain 2D scatter, sized by depth to keep the sense of perspective.
+    u, v, depth = _view_matrix(30, -60) @ np.stack([x, y, z])
+    order = np.argsort(depth)
+    depth_norm = (depth - depth.min()) / np.ptp(depth)
+    sizes = 14 * (0.7 + 0.6 * depth_norm)
+
+    ax = fig.add_subplot(111)
+    ax.scatter(u[order], v[order], s=sizes[order], c="#00D4FF", alpha=0.9)
+    ax.scatter([0], [0], s=260, c="#EAF2FF", edgecolors="#0b0f14", zorder=3)
     ax.set_title("Multi-shell geometry (illustrative)")
-    ax.set_xlabel("x")
-    ax.set_ylabel("y")
-    ax.set_zlabel("z")
-    ax.set_box_aspect((1.4, 1.0, 0.6))
+    ax.set_aspect("equal", adjustable="datalim")
+    ax.set_xticklabels([])
+    ax.set_yticklabels([])
     ax.grid(True)
 
     _finish(fig, "Constellation Designer", "Walker patterns, coverage cones, and shell comparisons", out_path)
 
 
-def thumb_crew_safety(out_path: Path):
+def thumb_crew_safety(fig: plt.Figure, out_path: Path):
     t = np.linspace(0, 180, 600)
     g = 1.0 + 2.8 * (1 - np.exp(-t / 50))
     vib = 0.35 * np.sin(2 * np.pi * 6.5 * t / 60) * np.exp(-t / 120)
     g_total = g + vib
 
-    fig, ax = plt.subplots(figsize=(12, 6.75))
+    ax = fig.add_subplot(111)
     ax.plot(t, g_total, color="#00D4FF", lw=2.6, label="Total g-load (sample)")
     ax.fill_between(t, g_total, 0, color="#00D4FF", alpha=0.10)
     ax.axhline(4.0, color="#FCA311", lw=2.0, alpha=0.85, linestyle="--", label="Crew comfort guideline (~4g)")
@@ -192,7 +253,7 @@ def thumb_crew_safety(out_path: Path):
     _finish(fig, "Crew Safety Simulator", "G-forces, vibration, damping, and comfort limits", out_path)
 
 
-def thumb_policy_calculator(out_path: Path):
+def thumb_policy_calculator(fig: plt.Figure, out_path: Path):
     # Simple radar-like visualization (illustrative)
     labels = ["Debris", "Licensing", "Spectrum", "Safety", "Planetary\nProtection"]
     vals = np.array([0.68, 0.55, 0.42, 0.62, 0.38])
@@ -200,7 +261,6 @@ def thumb_policy_calculator(out_path: Path):
     angles = np.concatenate([angles, angles[:1]])
     vals = np.concatenate([vals, vals[:1]])
 
-    fig = plt.figure(figsize=(12, 6.75))
     ax = fig.add_subplot(111, polar=True)
     ax.plot(angles, vals, color="#00D4FF", lw=2.6)
     ax.fill(angles, vals, color="#00D4FF", alpha=0.12)
@@ -211,12 +271,12 @@ def thumb_policy_calculator(out_path: Path):
     _finish(fig, "Space Policy Risk Calculator", "Regulatory, debris, and mission-risk scoring framework", out_path)
 
 
-def thumb_propellant_explorer(out_path: Path):
+def thumb_propellant_explorer(fig: plt.Figure, out_path: Path):
     fuels = ["Hydrolox", "Methalox", "RP-1", "Solid"]
     isp = [450, 380, 350, 280]
     dens = [0.07, 0.42, 0.81, 1.80]
 
-    fig, ax = plt.subplots(figsize=(12, 6.75))
+    ax = fig.add_subplot(111)
     ax.plot(dens, isp, marker="o", ms=8, lw=2.4, color="#00D4FF")
     for x, y, label in zip(dens, isp, fuels):
         ax.text(x + 0.03, y + 6, label, fontsize=11, color="#EAF2FF")
@@ -229,28 +289,65 @@ def thumb_propellant_explorer(out_path: Path):
     _finish(fig, "Propellant Explorer (Web App)", "Compare fuels, balance reactions, and compute Δv with sliders", out_path)
 
 
+THUMBS = {
+    "rocket_ascent.png": thumb_rocket_ascent,
+    "conic_orbits.png": thumb_conic_orbits,
+    "constellation_propagator.png": thumb_constellation_propagator,
+    "mars_mission.png": thumb_mars_mission,
+    "trade_simulator.png": thumb_trade_simulator,
+    "constellation_designer.png": thumb_constellation_designer,
+    "crew_safety.png": thumb_crew_safety,
+    "policy_calculator.png": thumb_policy_calculator,
+    "propellant_explorer.png": thumb_propellant_explorer,
+}
+
+_worker_fig: plt.Figure | None = None
+
+
+def _init_worker():
+    """Pool initializer: one reusable figure per worker process."""
+    global _worker_fig
+    _worker_fig = plt.figure(figsize=(12, 6.75))
+
+
+def _render_one(filename: str) -> str:
+    """Pool task: render one thumbnail into the worker's figure."""
+    # _finish() clears the figure after saving
+    THUMBS[filename](_worker_fig, OUT_DIR / filename)
+    return filename
+
+
+def _pool_context():
+    # On Linux, fork lets workers inherit the parent's imported matplotlib, rcParams
+    # and font cache. Forking after pyplot has loaded is unsafe on macOS, so other
+    # platforms keep their default (spawn), which re-imports this module and so
+    # re-applies _STYLE once per worker.
+    if sys.platform == "linux":
+        return multiprocessing.get_context("fork")
+    return multiprocessing.get_context()
+
+
 def main():
-    _base_style()
+    cache = _load_cache()
+    stale = [
+        filename
+        for filename, fn in THUMBS.items()
+        if cache.get(filename) != _source_hash(fn) or not (OUT_DIR / filename).exists()
+    ]
 
-    thumbs = {
-        "rocket_ascent.png": thumb_rocket_ascent,
-        "conic_orbits.png": thumb_conic_orbits,
-        "constellation_propagator.png": thumb_constellation_propagator,
-        "mars_mission.png": thumb_mars_mission,
-        "trade_simulator.png": thumb_trade_simulator,
-        "constellation_designer.png": thumb_constellation_designer,
-        "crew_safety.png": thumb_crew_safety,
-        "policy_calculator.png": thumb_policy_calculator,
-        "propellant_explorer.png": thumb_propellant_explorer,
-    }
+    # Thumbnails are independent files, so render them in parallel
+    if stale:
+        processes = min(len(stale), os.cpu_count() or 1)
+        with _pool_context().Pool(processes=processes, initializer=_init_worker) as pool:
+            for filename in pool.imap_unordered(_render_one, stale):
+                cache[filename] = _source_hash(THUMBS[filename])
 
-    for filename, fn in thumbs.items():
-        fn(OUT_DIR / filename)
+    OUT_DIR.mkdir(parents=True, exist_ok=True)
+    CACHE_PATH.write_text(json.dumps(cache, indent=2, sort_keys=True) + "\n")
 
-    print(f"Generated {len(thumbs)} thumbnails in {OUT_DIR.as_posix()}/")
+    skipped = len(THUMBS) - len(stale)
+    print(f"Generated {len(stale)} thumbnails in {OUT_DIR.as_posix()}/ ({skipped} up to date)")
 
 
 if __name__ == "__main__":
     main()
-
-
@@ -12,6 +12,8 @@ import matplotlib.animation as animation
 from matplotlib.widgets import Button
 from matplotlib.patches import FancyBboxPatch, Circle
 from matplotlib.lines import Line2D
+from matplotlib.collections import LineCollection
+from matplotlib.colors import to_rgba
 from dataclasses import dataclass
 import os
 
@@ -19,7 +21,7 @@ import os
 G = 6.67430e-11  # Gravitational Constant (m^3 kg^-1 s^-2)
 C = 299792458    # Speed of light (m/s)
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Body:
     name: str
     mass: float
@@ -102,6 +104,21 @@ MISSION_DATA = {
     },
 }
 
+# Panel text is constant, so format it once at import rather than per view switch
+for _mission in MISSION_DATA.values():
+    _mission['missions_bullets'] = [f"• {m}" for m in _mission['missions'][:3]]
+
+# Telemetry row pitch of 0.10 panel height at the default 16x10 figure, as a
+# multiple of the 10 pt monospace line height
+TELEM_LINESPACING = 6.25
+
+CORNER_SEGMENTS = [
+    [(0, 1), (0.05, 1)], [(0, 1), (0, 0.95)],
+    [(0.95, 1), (1, 1)], [(1, 1), (1, 0.95)],
+    [(0, 0), (0.05, 0)], [(0, 0), (0, 0.05)],
+    [(0.95, 0), (1, 0)], [(1, 0), (1, 0.05)],
+]
+
 
 def style_axis_scifi(ax, title="", xlabel="", ylabel=""):
     """Apply dark theme styling for aerospace visualization."""
@@ -110,9 +127,6 @@ def style_axis_scifi(ax, title="", xlabel="", ylabel=""):
     if title:
         ax.set_title(title, color='#00d4ff', fontsize=13, fontweight='bold',
                     pad=12, loc='left', fontfamily='monospace')
-        line = Line2D([0, 0.4], [1.02, 1.02], color='#00d4ff', alpha=0.8,
-                     lw=2, transform=ax.transAxes, clip_on=False)
-        ax.add_line(line)
     
     ax.set_xlabel(xlabel, color='#00d4ff', fontsize=11, labelpad=10,
                  fontfamily='monospace', fontweight='bold')
@@ -125,21 +139,20 @@ def style_axis_scifi(ax, title="", xlabel="", ylabel=""):
         spine.set_color('#0e4d64')
         spine.set_linewidth(2)
     
-    corners = [
-        ([0, 0.05], [1, 1]), ([0, 0], [1, 0.95]),
-        ([0.95, 1], [1, 1]), ([1, 1], [1, 0.95]),
-        ([0, 0.05], [0, 0]), ([0, 0], [0, 0.05]),
-        ([0.95, 1], [0, 0]), ([1, 1], [0, 0.05]),
-    ]
-    for x_coords, y_coords in corners:
-        corner = Line2D(x_coords, y_coords, color='#00d4ff', alpha=0.7,
-                       lw=2, transform=ax.transAxes, clip_on=False)
-        ax.add_line(corner)
+    # Corner brackets (+ title underline) drawn as one collection instead of 9 lines
+    segments = list(CORNER_SEGMENTS)
+    colors = [to_rgba('#00d4ff', 0.7)] * len(segments)
+    if title:
+        segments.append([(0, 1.02), (0.4, 1.02)])
+        colors.append(to_rgba('#00d4ff', 0.8))
+    ax.add_collection(LineCollection(segments, colors=colors, linewidths=2,
+                                     transform=ax.transAxes, clip_on=False, zorder=2),
+                      autolim=False)
     
     ax.grid(True, color='#0a2a3a', alpha=0.5, linestyle='-', linewidth=0.5)
 
 
-@dataclass
+@dataclass(slots=True)
 class Orbit:
     semi_major_axis: float
     eccentricity: float
@@ -190,6 +203,44 @@ class Orbit:
         return np.sqrt(-self.central_body.mu / self.semi_major_axis)
 
 
+def orbit_samples(a, e, mu, n=600):
+    """
+    Sample a conic orbit in a single vectorized pass.
+    
+    Returns (x, y, r, v, theta, mean_anomaly) with distances in km and speed
+    in km/s. mean_anomaly is None for hyperbolic orbits.
+    """
+    if e >= 1.0:
+        # Hyperbolic - limit to physical branch
+        limit = np.arccos(-1.0 / e) - 0.15
+        theta = np.linspace(-limit, limit, n)
+        cos_t = np.cos(theta)
+        mean_anomaly = None
+        
+        # Orbit equation: r = a(1-e²)/(1 + e·cos(θ))
+        r = a * (1 - e**2) / (1 + e * cos_t)
+        x = r * cos_t
+        y = r * np.sin(theta)
+        
+        # Vis-viva (hyperbolic, a < 0)
+        v = np.sqrt(mu * (2/r + 1/abs(a)))
+    else:
+        # Parametric ellipse in eccentric anomaly E (no division, r > 0 always)
+        E = np.linspace(0, 2*np.pi, n)
+        cos_E = np.cos(E)
+        sin_E = np.sin(E)
+        x = a * (cos_E - e)
+        y = a * np.sqrt(1 - e**2) * sin_E
+        r = a * (1 - e * cos_E)
+        theta = np.arctan2(y, x)
+        mean_anomaly = E - e * sin_E  # Kepler's equation: M = E - e·sin(E)
+        
+        # Vis-viva
+        v = np.sqrt(mu * (2/r - 1/a))
+    
+    return x * 1e-3, y * 1e-3, r * 1e-3, v * 1e-3, theta, mean_anomaly
+
+
 class OrbitDashboard:
     """Interactive dashboard for orbit visualization with real mission data."""
     
@@ -207,11 +258,11 @@ class OrbitDashboard:
         self.fig = plt.figure(figsize=(16, 10))
         self.fig.patch.set_facecolor('#050a12')
         
-        self.fig_texts = []
         self.button_axes = []
         self.anim = None
         
         self._setup_navigation()
+        self._build_view_layout()
         self._draw_current_view()
     
     def _precompute_orbits(self):
@@ -246,35 +297,27 @@ class OrbitDashboard:
     
     def _compute_orbit(self, orbit: Orbit):
         """Calculate orbit trajectory."""
-        if orbit.eccentricity >= 1.0:
-            # Hyperbolic - limit to physical branch
-            e = orbit.eccentricity
-            limit = np.arccos(-1.0 / e) - 0.15
-            theta = np.linspace(-limit, limit, 600)
-        else:
-            theta = np.linspace(0, 2*np.pi, 600)
+        x, y, r_km, v, theta, mean_anomaly = orbit_samples(
+            orbit.semi_major_axis, orbit.eccentricity, orbit.central_body.mu)
         
-        # Orbit equation: r = a(1-e²)/(1 + e·cos(θ))
-        p = orbit.semi_major_axis * (1 - orbit.eccentricity**2)
-        r = p / (1 + orbit.eccentricity * np.cos(theta))
+        body_radius_km = orbit.central_body.radius / 1000
         
-        x = r * np.cos(theta) / 1000  # km
-        y = r * np.sin(theta) / 1000
-        r_km = r / 1000
-        
-        # Velocity at each point (vis-viva)
-        if orbit.eccentricity >= 1.0:
-            v = np.sqrt(orbit.central_body.mu * (2/r + 1/abs(orbit.semi_major_axis))) / 1000
+        # Per-frame telemetry, precomputed so the animation only indexes
+        if mean_anomaly is None:
+            time_labels = [f"FRAME {i}" for i in range(len(theta))]
         else:
-            v = np.sqrt(orbit.central_body.mu * (2/r - 1/orbit.semi_major_axis)) / 1000
-        
-        mask = r > 0
+            elapsed_s = mean_anomaly / (2*np.pi) * orbit.period
+            time_labels = [f"T+ {int(t // 60)}:{int(t % 60):02d}" for t in elapsed_s]
         
         return {
             'orbit': orbit,
-            'x': x[mask], 'y': y[mask], 'r_km': r_km[mask],
-            'v_km_s': v[mask], 'theta': theta[mask],
-            'body_radius_km': orbit.central_body.radius / 1000
+            'x': x, 'y': y, 'r_km': r_km,  # km
+            'v_km_s': v, 'theta': theta,
+            'body_radius_km': body_radius_km,
+            'alt_km': r_km - body_radius_km,
+            'theta_deg': np.degrees(theta) % 360,
+            'range_rate': np.diff(r_km, prepend=r_km[0]) * 100,  # Approximate
+            'time_labels': time_labels,
         }
     
     def _setup_navigation(self):
@@ -310,17 +353,6 @@ class OrbitDashboard:
         if self.anim is not None:
             self.anim.event_source.stop()
             self.anim = None
-        
-        axes_to_remove = [ax for ax in self.fig.axes if ax not in self.button_axes]
-        for ax in axes_to_remove:
-            ax.remove()
-        
-        for txt in self.fig_texts:
-            try:
-                txt.remove()
-            except:
-                pass
-        self.fig_texts.clear()
     
     def _draw_current_view(self):
         self._clear_view()
@@ -340,60 +372,38 @@ class OrbitDashboard:
         
         self.fig.canvas.draw_idle()
     
-    def _add_title(self, main_title, subtitle=""):
-        t1 = self.fig.text(0.5, 0.96, f"◢ {main_title} ◣",
-                         fontsize=18, fontweight='bold', color='#00d4ff', ha='center',
-                         fontfamily='monospace')
-        self.fig_texts.append(t1)
-        if subtitle:
-            t2 = self.fig.text(0.5, 0.92, subtitle,
-                              fontsize=11, color='#7fdbff', ha='center', alpha=0.8,
-                              fontfamily='monospace')
-            self.fig_texts.append(t2)
-    
-    def _draw_orbit_with_telemetry(self, key, mission_key):
-        """Generic orbit drawing with rich telemetry."""
-        data = self.orbits[key]
-        orbit = data['orbit']
-        mission = MISSION_DATA[mission_key]
+    def _build_view_layout(self):
+        """Create the trajectory and info axes once; views only update artist data."""
+        self.title_txt = self.fig.text(0.5, 0.96, "", fontsize=18, fontweight='bold',
+                                       color='#00d4ff', ha='center', fontfamily='monospace')
+        self.subtitle_txt = self.fig.text(0.5, 0.92, "", fontsize=11, color='#7fdbff',
+                                          ha='center', alpha=0.8, fontfamily='monospace')
         
         # Main orbit plot
         ax = self.fig.add_axes([0.06, 0.15, 0.48, 0.72])
         style_axis_scifi(ax, "TRAJECTORY", "X [km]", "Y [km]")
+        ax.set_aspect('equal')
+        self.ax_traj = ax
         
-        # Central body
-        body_circle = Circle((0, 0), data['body_radius_km'], 
-                            color=orbit.central_body.color, alpha=0.8, zorder=2)
-        ax.add_patch(body_circle)
-        
-        # Atmosphere glow
-        if orbit.central_body.name == "Earth":
-            atmo = Circle((0, 0), data['body_radius_km'] * 1.025,
-                         color='#00d4ff', alpha=0.15, zorder=1)
-            ax.add_patch(atmo)
+        # Central body and atmosphere glow
+        self.body_circle = Circle((0, 0), 1, alpha=0.8, zorder=2)
+        ax.add_patch(self.body_circle)
+        self.atmo_patch = Circle((0, 0), 1, color='#00d4ff', alpha=0.15, zorder=1)
+        ax.add_patch(self.atmo_patch)
         
         # Orbit trajectory with glow
-        ax.plot(data['x'], data['y'], color='#00d4ff', lw=6, alpha=0.15, zorder=3)
-        ax.plot(data['x'], data['y'], color='#00d4ff', lw=2, alpha=0.9, zorder=4)
-        
-        # Spacecraft marker
-        spacecraft, = ax.plot([], [], marker='^', color='#00ff9f', markersize=14, zorder=5)
-        
-        # Set limits
-        if orbit.eccentricity > 1:
-            periapsis_dist = np.min(data['r_km'])
-            limit = periapsis_dist * 4
-        else:
-            limit = np.max(np.abs(data['r_km'])) * 1.15
+        self.orbit_glow, = ax.plot([], [], color='#00d4ff', lw=6, alpha=0.15, zorder=3)
+        self.orbit_line, = ax.plot([], [], color='#00d4ff', lw=2, alpha=0.9, zorder=4)
         
-        ax.set_xlim(-limit, limit)
-        ax.set_ylim(-limit, limit)
-        ax.set_aspect('equal')
+        # Spacecraft marker (animated: kept out of the cached blit background)
+        self.spacecraft, = ax.plot([], [], marker='^', color='#00ff9f', markersize=14,
+                                   zorder=5, animated=True)
         
         # Info panel
         ax_info = self.fig.add_axes([0.58, 0.15, 0.38, 0.72])
         ax_info.set_facecolor('#050a12')
         ax_info.axis('off')
+        self.ax_info = ax_info
         
         panel = FancyBboxPatch((0.02, 0.02), 0.96, 0.96,
                                boxstyle="round,pad=0.02,rounding_size=0.02",
@@ -407,21 +417,22 @@ class OrbitDashboard:
                     fontfamily='monospace')
         
         # Dynamic telemetry values
-        time_txt = ax_info.text(0.5, 0.89, "T+ 0:00", transform=ax_info.transAxes,
-                               fontsize=14, color='#ffd700', ha='center', fontweight='bold',
-                               fontfamily='monospace')
-        
+        self.time_txt = ax_info.text(0.5, 0.89, "T+ 0:00", transform=ax_info.transAxes,
+                                     fontsize=14, color='#ffd700', ha='center',
+                                     fontweight='bold', fontfamily='monospace',
+                                     animated=True)
+        
+        # Labels are one static block and values one animated block with the same
+        # size and linespacing, so the rows share line metrics and stay aligned.
+        # Both are anchored at the last row's baseline.
         telem_labels = ["ALTITUDE", "VELOCITY", "TRUE ANOMALY", "RANGE RATE"]
-        telem_colors = ["#00d4ff", "#ff6b35", "#00ff9f", "#ffd700"]
-        telem_txts = []
-        
-        for i, (label, col) in enumerate(zip(telem_labels, telem_colors)):
-            y = 0.80 - i * 0.10
-            ax_info.text(0.08, y, f"► {label}", transform=ax_info.transAxes, fontsize=9,
-                        color=col, fontfamily='monospace', fontweight='bold')
-            txt = ax_info.text(0.55, y, "---", transform=ax_info.transAxes, fontsize=11,
-                              color='#ffffff', fontfamily='monospace')
-            telem_txts.append(txt)
+        ax_info.text(0.08, 0.50, "\n".join(f"► {label}" for label in telem_labels),
+                    transform=ax_info.transAxes, fontsize=10, linespacing=TELEM_LINESPACING,
+                    color='#00d4ff', fontfamily='monospace', fontweight='bold')
+        self.telem_block = ax_info.text(0.55, 0.50, "\n".join(["---"] * len(telem_labels)),
+                                        transform=ax_info.transAxes, fontsize=10,
+                                        linespacing=TELEM_LINESPACING, color='#ffffff',
+                                        fontfamily='monospace', animated=True)
         
         # Divider
         div = Line2D([0.05, 0.95], [0.42, 0.42], color='#00d4ff', alpha=0.3, lw=1,
@@ -434,59 +445,75 @@ class OrbitDashboard:
                     fontfamily='monospace')
         
         # Real mission examples
-        for i, mission_txt in enumerate(mission['missions'][:3]):
-            y = 0.32 - i * 0.06
-            ax_info.text(0.08, y, f"• {mission_txt}", transform=ax_info.transAxes,
-                        fontsize=8, color='#aaaaaa', fontfamily='monospace')
+        self.mission_txts = [
+            ax_info.text(0.08, 0.32 - i * 0.06, "", transform=ax_info.transAxes,
+                         fontsize=8, color='#aaaaaa', fontfamily='monospace')
+            for i in range(3)
+        ]
         
         # Fun facts
         ax_info.text(0.5, 0.12, "◢ DID YOU KNOW? ◣", transform=ax_info.transAxes,
                     fontsize=9, fontweight='bold', color='#00ff9f', ha='center',
                     fontfamily='monospace')
         
-        fact = mission['facts'][0]
-        ax_info.text(0.5, 0.06, fact, transform=ax_info.transAxes,
-                    fontsize=8, color='#7fdbff', ha='center', fontfamily='monospace',
-                    wrap=True)
+        self.fact_txt = ax_info.text(0.5, 0.06, "", transform=ax_info.transAxes,
+                                     fontsize=8, color='#7fdbff', ha='center',
+                                     fontfamily='monospace', wrap=True)
+    
+    def _draw_orbit_with_telemetry(self, key, mission_key):
+        """Generic orbit drawing with rich telemetry."""
+        data = self.orbits[key]
+        orbit = data['orbit']
+        body = orbit.central_body
+        mission = MISSION_DATA[mission_key]
+        
+        self.title_txt.set_text(f"◢ {mission['name']} ◣")
+        self.subtitle_txt.set_text(mission['subtitle'])
+        
+        # Central body and atmosphere glow (Earth only)
+        self.body_circle.set_radius(data['body_radius_km'])
+        self.body_circle.set_color(body.color)
+        self.atmo_patch.set_radius(data['body_radius_km'] * 1.025)
+        self.atmo_patch.set_visible(body.name == "Earth")
+        
+        self.orbit_glow.set_data(data['x'], data['y'])
+        self.orbit_line.set_data(data['x'], data['y'])
         
-        self._add_title(mission['name'], mission['subtitle'])
+        # Set limits
+        if orbit.eccentricity > 1:
+            periapsis_dist = np.min(data['r_km'])
+            limit = periapsis_dist * 4
+        else:
+            limit = np.max(np.abs(data['r_km'])) * 1.15
+        
+        self.ax_traj.set_xlim(-limit, limit)
+        self.ax_traj.set_ylim(-limit, limit)
+        
+        for txt, line in zip(self.mission_txts, mission['missions_bullets']):
+            txt.set_text(line)
+        self.fact_txt.set_text(mission['facts'][0])
         
-        # Animation with live telemetry
+        spacecraft = self.spacecraft
+        time_txt = self.time_txt
+        telem_block = self.telem_block
+        
+        # Animation with live telemetry. Everything else is static and ends up in
+        # the blit background; only the marker and telemetry texts are redrawn.
         def update(frame):
             if len(data['x']) == 0:
-                return [spacecraft, time_txt] + telem_txts
+                return [spacecraft, time_txt, telem_block]
             
             idx = frame % len(data['x'])
             spacecraft.set_data([data['x'][idx]], [data['y'][idx]])
+            time_txt.set_text(data['time_labels'][idx])
+            telem_block.set_text(
+                f"{data['alt_km'][idx]:.1f} km\n"
+                f"{data['v_km_s'][idx]:.3f} km/s\n"
+                f"{data['theta_deg'][idx]:.1f}°\n"
+                f"{data['range_rate'][idx]:+.2f} km/s"
+            )
             
-            # Calculate orbital time
-            if orbit.eccentricity < 1.0:
-                period_min = orbit.period / 60
-                elapsed = (idx / len(data['x'])) * period_min
-                mins = int(elapsed)
-                secs = int((elapsed - mins) * 60)
-                time_txt.set_text(f"T+ {mins}:{secs:02d}")
-            else:
-                time_txt.set_text(f"FRAME {idx}")
-            
-            # Update telemetry
-            alt = data['r_km'][idx] - data['body_radius_km']
-            vel = data['v_km_s'][idx]
-            theta_deg = np.degrees(data['theta'][idx]) % 360
-            
-            # Range rate (radial velocity component)
-            if idx > 0:
-                dr = data['r_km'][idx] - data['r_km'][idx-1]
-                range_rate = dr * 100  # Approximate
-            else:
-                range_rate = 0
-            
-            telem_txts[0].set_text(f"{alt:.1f} km")
-            telem_txts[1].set_text(f"{vel:.3f} km/s")
-            telem_txts[2].set_text(f"{theta_deg:.1f}°")
-            telem_txts[3].set_text(f"{range_rate:+.2f} km/s")
-            
-            return [spacecraft, time_txt] + telem_txts
+            return [spacecraft, time_txt, telem_block]
         
         self.anim = animation.FuncAnimation(self.fig, update, frames=len(data['x']),
                                            interval=30, blit=True)
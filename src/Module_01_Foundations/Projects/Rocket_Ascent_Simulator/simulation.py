@@ -6,14 +6,27 @@ Module 1: Foundations in Math, Physics, and Computation
 Models thrust, gravity, atmospheric drag, and mass depletion.
 """
 
+import math
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 from matplotlib.widgets import Button
 from matplotlib.patches import FancyBboxPatch
 from matplotlib.lines import Line2D
+from matplotlib.colors import to_rgba
+from matplotlib import patheffects
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, Sequence, Tuple
+
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; the kernels below also run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+    prange = range
 
 # --- Constants ---
 G = 6.67430e-11
@@ -21,6 +34,28 @@ M_EARTH = 5.972e24
 R_EARTH = 6371000
 SEA_LEVEL_DENSITY = 1.225
 SCALE_HEIGHT = 8500
+G0 = 9.80665
+
+# --- Pitch program ---
+# Thrust tilts from radial toward the velocity vector at a constant rate until
+# PITCH_MAX, faded in smoothly over the first PITCH_BLEND_SPEED m/s of flight
+PITCH_MAX = 0.3
+PITCH_RATE = PITCH_MAX / 60.0   # per second
+PITCH_BLEND_SPEED = 50.0        # m/s
+
+# Line plots are downsampled to at most this many points for display
+MAX_PLOT_POINTS = 1000
+
+# Telemetry row pitch as a multiple of the 12 pt monospace line height: 0.15 of
+# the profile-view info panel and 0.12 of the 3D-view panel at the default 16x10 figure
+TELEM_LINESPACING = 7.43
+TELEM_3D_LINESPACING = 6.4
+
+# --- History columns (one row per recorded step) ---
+HISTORY_FIELDS = ('time', 'x', 'y', 'z', 'vx', 'vy', 'vz',
+                  'altitude', 'mass', 'dynamic_pressure', 'acceleration')
+(COL_TIME, COL_X, COL_Y, COL_Z, COL_VX, COL_VY, COL_VZ,
+ COL_ALT, COL_MASS, COL_Q, COL_ACCEL) = range(len(HISTORY_FIELDS))
 
 
 def style_axis_scifi(ax, title="", xlabel="", ylabel="", is_3d=False):
@@ -67,6 +102,300 @@ def style_axis_scifi(ax, title="", xlabel="", ylabel="", is_3d=False):
                               transform=ax.transAxes, clip_on=False))
 
 
+def glow_plot(ax, *data, color, lw=1.5):
+    """Plot one line with a wider translucent halo drawn by a path effect."""
+    line, = ax.plot(*data, color=color, lw=lw)
+    line.set_path_effects([patheffects.Stroke(linewidth=2 * lw, foreground=color, alpha=0.3),
+                           patheffects.Normal()])
+    return line
+
+
+def downsample_lttb(x: np.ndarray, y: np.ndarray, n_out: int = MAX_PLOT_POINTS) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling of the series y(x).
+    
+    Keeps the first and last points and, from each of n_out-2 buckets in
+    between, the point forming the largest triangle with the previously kept
+    point and the mean of the next bucket. Returns the kept indices.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    idx = np.empty(n_out, dtype=np.intp)
+    idx[0], idx[-1] = 0, n - 1
+    a = 0
+    for b in range(n_out - 2):
+        lo, hi = edges[b], edges[b + 1]
+        nlo, nhi = (edges[b + 1], edges[b + 2]) if b + 2 < len(edges) else (n - 1, n)
+        cx, cy = x[nlo:nhi].mean(), y[nlo:nhi].mean()
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        idx[b + 1] = a
+    return idx
+
+
+# --- Integration kernels ---
+# Scalar code on raw float64 buffers: compiled by Numba when available, and still
+# free of small-array allocations when run as plain Python.
+# params = [thrust, mass_flow, drag_k (0.5*Cd*A), burn_time, dry_mass]
+
+@njit(cache=True, fastmath=True)
+def _air_density(altitude):
+    """Exponential-atmosphere density (kg/m^3), clamped to sea level below ground."""
+    if altitude < 0:
+        return SEA_LEVEL_DENSITY
+    return SEA_LEVEL_DENSITY * math.exp(-altitude / SCALE_HEIGHT)
+
+
+@njit(cache=True, fastmath=True)
+def _derivatives_kernel(t, state, out, params):
+    """Write d(state)/dt for state [x, y, z, vx, vy, vz, m] into out."""
+    thrust, mass_flow, drag_k, burn_time, dry_mass = (
+        params[0], params[1], params[2], params[3], params[4])
+    rx, ry, rz = state[0], state[1], state[2]
+    vx, vy, vz = state[3], state[4], state[5]
+    m = state[6]
+    
+    r_mag = math.sqrt(rx*rx + ry*ry + rz*rz)
+    v_mag = math.sqrt(vx*vx + vy*vy + vz*vz)
+    inv_r = 1.0 / r_mag if r_mag > 0 else 0.0
+    inv_v = 1.0 / v_mag if v_mag > 0 else 0.0
+    altitude = r_mag - R_EARTH
+    
+    # Gravity - always present: -GM r / |r|^3
+    g_coef = -G * M_EARTH * inv_r * inv_r * inv_r
+    
+    # Drag - opposes velocity: |a| = 0.5*rho*v²*Cd*A / m
+    drag_coef = -drag_k * _air_density(altitude) * v_mag / m
+    
+    # Thrust along unit direction (dx, dy, dz)
+    a_thrust = 0.0
+    dx = dy = dz = 0.0
+    dm_dt = 0.0
+    if t < burn_time and m > dry_mass:
+        # Gravity turn - blend radial and velocity direction (pitch program).
+        # Branchless: a smoothstep in speed replaces the on/off switch at low speed.
+        w = min(v_mag * (1.0 / PITCH_BLEND_SPEED), 1.0)
+        pitch = min(t * PITCH_RATE, PITCH_MAX) * (w * w * (3.0 - 2.0 * w))
+        radial = (1.0 - pitch) * inv_r
+        along = pitch * inv_v
+        dx = radial * rx + along * vx
+        dy = radial * ry + along * vy
+        dz = radial * rz + along * vz
+        inv_d = 1.0 / math.sqrt(dx*dx + dy*dy + dz*dz)
+        dx, dy, dz = dx * inv_d, dy * inv_d, dz * inv_d
+        
+        a_thrust = thrust / m
+        dm_dt = -mass_flow
+    
+    # Gravity + drag + thrust in one pass per axis
+    out[0] = vx
+    out[1] = vy
+    out[2] = vz
+    out[3] = g_coef * rx + drag_coef * vx + a_thrust * dx
+    out[4] = g_coef * ry + drag_coef * vy + a_thrust * dy
+    out[5] = g_coef * rz + drag_coef * vz + a_thrust * dz
+    out[6] = dm_dt
+
+@njit(cache=True, fastmath=True)
+def _rk4_kernel(t, state, dt, half_dt, sixth_dt, out, params, k1, k2, k3, k4, tmp):
+    """
+    Single RK4 step from state into out, using caller-owned stage buffers.
+    half_dt and sixth_dt are dt/2 and dt/6, computed once by the caller.
+    """
+    n = state.shape[0]
+    t_half = t + half_dt
+    _derivatives_kernel(t, state, k1, params)
+    for i in range(n):
+        tmp[i] = state[i] + half_dt*k1[i]
+    _derivatives_kernel(t_half, tmp, k2, params)
+    for i in range(n):
+        tmp[i] = state[i] + half_dt*k2[i]
+    _derivatives_kernel(t_half, tmp, k3, params)
+    for i in range(n):
+        tmp[i] = state[i] + dt*k3[i]
+    _derivatives_kernel(t + dt, tmp, k4, params)
+    for i in range(n):
+        out[i] = state[i] + sixth_dt * (k1[i] + 2.0*(k2[i] + k3[i]) + k4[i])
+
+
+# Dormand-Prince 5(4) tableau: stage nodes, stage weights, 5th-order solution
+# (also the FSAL 7th stage) and the 5th-minus-4th-order error weights
+DP_C = np.array([0.0, 1/5, 3/10, 4/5, 8/9, 1.0, 1.0])
+DP_A = np.array([
+    [0.0, 0.0, 0.0, 0.0, 0.0, 0.0],
+    [1/5, 0.0, 0.0, 0.0, 0.0, 0.0],
+    [3/40, 9/40, 0.0, 0.0, 0.0, 0.0],
+    [44/45, -56/15, 32/9, 0.0, 0.0, 0.0],
+    [19372/6561, -25360/2187, 64448/6561, -212/729, 0.0, 0.0],
+    [9017/3168, -355/33, 46732/5247, 49/176, -5103/18656, 0.0],
+    [35/384, 0.0, 500/1113, 125/192, -2187/6784, 11/84],
+])
+DP_E = np.array([71/57600, 0.0, -71/16695, 71/1920, -17253/339200, 22/525, -1/40])
+
+
+@njit(cache=True, fastmath=True)
+def _record_row(row, t, state, deriv):
+    """Fill one history row from a state and its derivative."""
+    rx, ry, rz, vx, vy, vz = state[0], state[1], state[2], state[3], state[4], state[5]
+    alt = math.sqrt(rx*rx + ry*ry + rz*rz) - R_EARTH
+    row[COL_TIME] = t
+    for j in range(6):
+        row[COL_X + j] = state[j]
+    row[COL_ALT] = alt
+    row[COL_MASS] = state[6]
+    row[COL_Q] = 0.5 * _air_density(alt) * (vx*vx + vy*vy + vz*vz)
+    row[COL_ACCEL] = math.sqrt(deriv[3]*deriv[3] + deriv[4]*deriv[4]
+                               + deriv[5]*deriv[5]) / 9.81
+
+
+@njit(cache=True, fastmath=True)
+def _dopri5_run(state0, duration, dt_out, params, rtol, atol, hist):
+    """
+    Adaptive Dormand-Prince 5(4) integration with a PI step controller.
+    
+    Internal steps are sized by the embedded error estimate; the last stage is
+    reused as the next step's first (FSAL), so an accepted step costs six
+    derivative evaluations. History rows are sampled every dt_out by cubic
+    Hermite interpolation between accepted steps.
+    Returns (rows recorded, accepted steps, impacted).
+    """
+    n = state0.shape[0]
+    k = np.empty((7, n))
+    y = state0.copy()
+    y_new = np.empty(n)
+    tmp = np.empty(n)
+    s_out = np.empty(n)
+    d_out = np.empty(n)
+    
+    safety, fac_min, fac_max = 0.9, 0.2, 10.0
+    beta = 0.04
+    alpha = 0.2 - 0.75 * beta
+    err_old = 1e-4
+    
+    t = 0.0
+    h = dt_out
+    _derivatives_kernel(t, y, k[0], params)
+    _record_row(hist[0], t, y, k[0])
+    n_rows = 1
+    n_steps = 0
+    rejected = False
+    
+    while n_rows < hist.shape[0]:
+        t_next_out = n_rows * dt_out
+        if t_next_out > duration:
+            break
+        
+        # Stages 2..7 (stage 7 is evaluated at the 5th-order solution)
+        for s in range(1, 7):
+            for i in range(n):
+                acc = 0.0
+                for j in range(s):
+                    acc += DP_A[s, j] * k[j, i]
+                tmp[i] = y[i] + h * acc
+            _derivatives_kernel(t + DP_C[s] * h, tmp, k[s], params)
+        for i in range(n):
+            y_new[i] = tmp[i]
+        
+        # Scaled RMS error of the embedded 4th-order solution
+        err = 0.0
+        for i in range(n):
+            e = 0.0
+            for j in range(7):
+                e += DP_E[j] * k[j, i]
+            sc = atol + rtol * max(abs(y[i]), abs(y_new[i]))
+            err += (h * e / sc) ** 2
+        err = max(math.sqrt(err / n), 1e-10)
+        
+        if err > 1.0:
+            h *= max(fac_min, safety * err ** -alpha)
+            rejected = True
+            continue
+        
+        # Accepted: sample every output time inside (t, t + h]
+        t_new = t + h
+        while n_rows < hist.shape[0] and n_rows * dt_out <= min(t_new, duration):
+            t_o = n_rows * dt_out
+            u = (t_o - t) / h
+            h00 = 2*u**3 - 3*u**2 + 1
+            h10 = u**3 - 2*u**2 + u
+            h01 = -2*u**3 + 3*u**2
+            h11 = u**3 - u**2
+            g00 = (6*u**2 - 6*u) / h
+            g10 = 3*u**2 - 4*u + 1
+            g01 = (-6*u**2 + 6*u) / h
+            g11 = 3*u**2 - 2*u
+            for i in range(n):
+                s_out[i] = h00*y[i] + h10*h*k[0, i] + h01*y_new[i] + h11*h*k[6, i]
+                d_out[i] = g00*y[i] + g10*k[0, i] + g01*y_new[i] + g11*k[6, i]
+            # Stop if crashed
+            rx, ry, rz = s_out[0], s_out[1], s_out[2]
+            if math.sqrt(rx*rx + ry*ry + rz*rz) - R_EARTH < -100:
+                return n_rows, n_steps, True
+            # d_out[3:6] is the time derivative of the interpolated velocity
+            _record_row(hist[n_rows], t_o, s_out, d_out)
+            n_rows += 1
+        
+        for i in range(n):
+            y[i] = y_new[i]
+            k[0, i] = k[6, i]  # FSAL
+        t = t_new
+        n_steps += 1
+        
+        fac = safety * err ** -alpha * err_old ** beta
+        fac = min(1.0 if rejected else fac_max, max(fac_min, fac))
+        h *= fac
+        err_old = max(err, 1e-4)
+        rejected = False
+    
+    return n_rows, n_steps, False
+
+
+@njit(cache=True, fastmath=True)
+def _rk4_run(state0, duration, dt, params, hist):
+    """Fixed-step RK4 from t=0, one history row per step. Returns (rows recorded, impacted)."""
+    n = state0.shape[0]
+    state = state0.copy()
+    next_state = np.empty(n)
+    k1 = np.empty(n)
+    k2 = np.empty(n)
+    k3 = np.empty(n)
+    k4 = np.empty(n)
+    tmp = np.empty(n)
+    
+    half_dt = 0.5 * dt
+    sixth_dt = dt / 6.0
+    t = 0.0
+    i = 0
+    while t <= duration and i < hist.shape[0]:
+        # Stop if crashed
+        rx, ry, rz = state[0], state[1], state[2]
+        if math.sqrt(rx*rx + ry*ry + rz*rz) - R_EARTH < -100:
+            return i, True
+        _rk4_kernel(t, state, dt, half_dt, sixth_dt, next_state, params, k1, k2, k3, k4, tmp)
+        _record_row(hist[i], t, state, k1)
+        state, next_state = next_state, state
+        t += dt
+        i += 1
+    return i, False
+
+
+@njit(cache=True, parallel=True)
+def _rk4_ensemble(states0, duration, dt, params, hist, n_rows):
+    """Integrate K independent trajectories, one per parallel iteration."""
+    for k in prange(states0.shape[0]):
+        n_rows[k], _ = _rk4_run(states0[k], duration, dt, params[k], hist[k])
+
+
+def _pack_params(rocket: 'RocketParams') -> np.ndarray:
+    """Rocket constants packed for the integration kernels."""
+    return np.array([rocket.thrust, rocket.thrust / (rocket.isp * G0),
+                     0.5 * rocket.drag_coeff * rocket.area,
+                     rocket.burn_time, rocket.dry_mass])
+
+
 @dataclass
 class RocketParams:
     """Falcon 9-like rocket parameters."""
@@ -84,140 +413,119 @@ class RocketSimulator:
     
     def __init__(self, rocket: RocketParams):
         self.rocket = rocket
-        self.history: Dict[str, List[float]] = {
-            'time': [], 'x': [], 'y': [], 'z': [],
-            'vx': [], 'vy': [], 'vz': [],
-            'altitude': [], 'mass': [], 'dynamic_pressure': [],
-            'acceleration': []
-        }
-
-    def _get_gravity(self, r: np.ndarray) -> np.ndarray:
-        """Gravitational acceleration toward Earth center."""
-        r_mag = np.linalg.norm(r)
-        if r_mag == 0:
-            return np.zeros(3)
-        return -(G * M_EARTH / r_mag**2) * (r / r_mag)
+        self.hist = np.empty((0, len(HISTORY_FIELDS)))  # filled by run(), COL_* columns
+        self.n_steps = 0
+
+    @property
+    def history(self) -> Dict[str, np.ndarray]:
+        """Per-field column views of the recorded history."""
+        return {name: self.hist[:, col] for col, name in enumerate(HISTORY_FIELDS)}
 
     def _get_density(self, altitude: float) -> float:
         """Atmospheric density using exponential model."""
-        if altitude < 0:
-            return SEA_LEVEL_DENSITY
-        return SEA_LEVEL_DENSITY * np.exp(-altitude / SCALE_HEIGHT)
+        return _air_density(altitude)
+
+    def _kernel_params(self) -> np.ndarray:
+        """Rocket constants packed for the integration kernels."""
+        return _pack_params(self.rocket)
 
     def _derivatives(self, t: float, state: np.ndarray) -> np.ndarray:
         """Compute state derivatives for RK4."""
-        r = state[:3]
-        v = state[3:6]
-        m = state[6]
-        
-        r_mag = np.linalg.norm(r)
-        v_mag = np.linalg.norm(v)
-        altitude = r_mag - R_EARTH
-        
-        # Gravity - always present
-        a_gravity = self._get_gravity(r)
-        
-        # Drag - opposes velocity
-        rho = self._get_density(altitude)
-        if v_mag > 0:
-            v_hat = v / v_mag
-            drag_force = 0.5 * rho * v_mag**2 * self.rocket.drag_coeff * self.rocket.area
-            a_drag = -(drag_force / m) * v_hat
-        else:
-            a_drag = np.zeros(3)
-        
-        # Thrust
-        a_thrust = np.zeros(3)
-        dm_dt = 0.0
-        
-        if t < self.rocket.burn_time and m > self.rocket.dry_mass:
-            # Initial vertical ascent, then gravity turn
-            r_hat = r / r_mag
-            
-            if v_mag < 50:
-                # Vertical launch phase
-                thrust_dir = r_hat
-            else:
-                # Gravity turn - thrust along velocity with slight pitch program
-                # Blend between radial and velocity direction
-                pitch_angle = min(t / 60.0, 1.0) * 0.3  # Gradually pitch over
-                thrust_dir = (1 - pitch_angle) * r_hat + pitch_angle * (v / v_mag)
-                thrust_dir = thrust_dir / np.linalg.norm(thrust_dir)
-            
-            a_thrust = (self.rocket.thrust / m) * thrust_dir
-            
-            # Mass flow rate: mdot = T / (Isp * g0)
-            g0 = 9.80665
-            dm_dt = -self.rocket.thrust / (self.rocket.isp * g0)
-        
-        a_total = a_gravity + a_drag + a_thrust
-        return np.concatenate([v, a_total, [dm_dt]])
+        out = np.empty(7)
+        _derivatives_kernel(t, state, out, self._kernel_params())
+        return out
 
     def _rk4_step(self, t: float, state: np.ndarray, dt: float) -> np.ndarray:
         """Single RK4 integration step."""
-        k1 = self._derivatives(t, state)
-        k2 = self._derivatives(t + 0.5*dt, state + 0.5*dt*k1)
-        k3 = self._derivatives(t + 0.5*dt, state + 0.5*dt*k2)
-        k4 = self._derivatives(t + dt, state + dt*k3)
-        return state + (dt/6.0) * (k1 + 2*k2 + 2*k3 + k4)
-
-    def run(self, duration: float = 500.0, dt: float = 0.5):
-        """Run the simulation."""
+        out = np.empty(7)
+        k1, k2, k3, k4, tmp = np.empty((5, 7))
+        _rk4_kernel(t, state, dt, 0.5 * dt, dt / 6.0, out, self._kernel_params(),
+                    k1, k2, k3, k4, tmp)
+        return out
+
+    def run(self, duration: float = 500.0, dt: float = 0.5, method: str = 'rk4',
+            rtol: float = 1e-9, atol: float = 1e-6):
+        """
+        Run the simulation, recording history every dt seconds.
+        
+        method='rk4' integrates with fixed steps of dt. method='dopri5' takes
+        adaptive Dormand-Prince steps to rtol/atol and interpolates onto the
+        same dt grid, so long smooth phases need far fewer derivative calls.
+        """
+        if method not in ('rk4', 'dopri5'):
+            raise ValueError(f"Unknown integration method: {method!r}")
+        
         # Start on Earth's surface (x-axis, equator)
         state = np.array([R_EARTH, 0, 0, 0, 0, 0, self.rocket.wet_mass], dtype=float)
-        t = 0.0
         
         print(f"Simulating Falcon 9 ascent...")
         print(f"  Wet Mass: {self.rocket.wet_mass/1000:.0f} tonnes")
         print(f"  Thrust: {self.rocket.thrust/1e6:.1f} MN")
         print(f"  T/W Ratio: {self.rocket.thrust/(self.rocket.wet_mass*9.81):.2f}")
         
-        while t <= duration:
-            r = state[:3]
-            v = state[3:6]
-            m = state[6]
-            
-            r_mag = np.linalg.norm(r)
-            v_mag = np.linalg.norm(v)
-            alt = r_mag - R_EARTH
-            
-            # Stop if crashed
-            if alt < -100:
-                print(f"  Impact at T+{t:.1f}s")
-                break
-            
-            # Record state
-            self.history['time'].append(t)
-            self.history['x'].append(r[0])
-            self.history['y'].append(r[1])
-            self.history['z'].append(r[2])
-            self.history['vx'].append(v[0])
-            self.history['vy'].append(v[1])
-            self.history['vz'].append(v[2])
-            self.history['altitude'].append(alt)
-            self.history['mass'].append(m)
-            
-            # Dynamic pressure
-            rho = self._get_density(alt)
-            q = 0.5 * rho * v_mag**2
-            self.history['dynamic_pressure'].append(q)
-            
-            # Acceleration magnitude
-            derivs = self._derivatives(t, state)
-            a_mag = np.linalg.norm(derivs[3:6])
-            self.history['acceleration'].append(a_mag / 9.81)  # in G's
-            
-            state = self._rk4_step(t, state, dt)
-            t += dt
+        params = self._kernel_params()
+        
+        # Preallocated history, trimmed to the recorded steps afterwards.
+        # The whole integration loop runs inside one compiled kernel call.
+        n_max = int(duration / dt) + 2
+        hist = np.empty((n_max, len(HISTORY_FIELDS)))
+        
+        if method == 'dopri5':
+            i, n_accepted, impacted = _dopri5_run(state, duration, dt, params, rtol, atol, hist)
+            print(f"  Adaptive steps: {n_accepted} (fixed-step RK4: {n_max - 1})")
+        else:
+            i, impacted = _rk4_run(state, duration, dt, params, hist)
+        
+        # The kernels stop at the first sample below ground, row i
+        if impacted:
+            print(f"  Impact at T+{i*dt:.1f}s")
+        
+        self.n_steps = i
+        self.hist = hist[:i]
         
-        max_alt = max(self.history['altitude']) / 1000
-        max_vel = max(np.sqrt(np.array(self.history['vx'])**2 + 
-                              np.array(self.history['vy'])**2 + 
-                              np.array(self.history['vz'])**2))
+        max_alt = self.hist[:, COL_ALT].max() / 1000
+        max_vel = np.linalg.norm(self.hist[:, COL_VX:COL_VZ + 1], axis=1).max()
         print(f"  Max Altitude: {max_alt:.1f} km")
         print(f"  Max Velocity: {max_vel:.0f} m/s ({max_vel/1000:.1f} km/s)")
 
 
+def run_ensemble(rockets: Sequence[RocketParams], duration: float = 500.0,
+                 dt: float = 0.5) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Fly one fixed-step RK4 ascent per vehicle, in parallel when Numba is available.
+    
+    Returns (hist, n_steps): hist[k, :n_steps[k]] is vehicle k's history in the
+    same COL_* layout as RocketSimulator.hist.
+    """
+    n_max = int(duration / dt) + 2
+    states0 = np.array([[R_EARTH, 0, 0, 0, 0, 0, rk.wet_mass] for rk in rockets], dtype=float)
+    params = np.array([_pack_params(rk) for rk in rockets])
+    hist = np.empty((len(rockets), n_max, len(HISTORY_FIELDS)))
+    n_steps = np.zeros(len(rockets), dtype=np.int64)
+    _rk4_ensemble(states0, duration, dt, params, hist, n_steps)
+    return hist, n_steps
+
+
+def make_integrator(rocket: RocketParams, dt: float):
+    """
+    Build a fixed-step RK4 integrator specialized for one vehicle and step size.
+    
+    The packed vehicle constants and dt are closure constants, so Numba folds
+    them into the compiled loop instead of reading them from arguments. Each
+    integrator compiles on first call (not cached on disk), which pays off
+    only when one vehicle is flown many times.
+    Returns integrate(state0, duration, hist) -> (rows recorded, impacted), like _rk4_run.
+    """
+    params = _pack_params(rocket)
+    dt = float(dt)
+    
+    @njit(fastmath=True)
+    def integrate(state0, duration, hist):
+        return _rk4_run(state0, duration, dt, params, hist)
+    
+    return integrate
+
+
 class AscentDashboard:
     """Interactive dashboard with live telemetry."""
     
@@ -245,26 +553,33 @@ class AscentDashboard:
         self._draw_current_view()
     
     def _process_data(self):
-        """Convert history to numpy arrays."""
-        self.time = np.array(self.sim.history['time'])
-        self.alt_km = np.array(self.sim.history['altitude']) / 1000.0
-        self.vel_mag = np.sqrt(np.array(self.sim.history['vx'])**2 + 
-                               np.array(self.sim.history['vy'])**2 + 
-                               np.array(self.sim.history['vz'])**2)
-        self.q_kpa = np.array(self.sim.history['dynamic_pressure']) / 1000.0
-        self.mass = np.array(self.sim.history['mass']) / 1000  # tonnes
-        self.accel_g = np.array(self.sim.history['acceleration'])
-        
-        # 3D trajectory in km
-        x = np.array(self.sim.history['x'])
-        y = np.array(self.sim.history['y'])
-        z = np.array(self.sim.history['z'])
-        
-        # Convert to local coordinates (relative to launch site)
-        # Launch site is at [R_EARTH, 0, 0]
-        self.traj_up = (np.sqrt(x**2 + y**2 + z**2) - R_EARTH) / 1000  # altitude
-        self.traj_east = np.arctan2(y, x) * R_EARTH / 1000  # downrange
-        self.traj_north = z / 1000
+        """Slice display series out of the history columns."""
+        hist = self.sim.hist
+        self.time = hist[:, COL_TIME]
+        self.alt_km = hist[:, COL_ALT] / 1000.0
+        vel = hist[:, COL_VX:COL_VZ + 1]
+        self.vel_mag = np.sqrt(np.einsum('ij,ij->i', vel, vel))
+        self.q_kpa = hist[:, COL_Q] / 1000.0
+        self.mass = hist[:, COL_MASS] / 1000  # tonnes
+        self.accel_g = hist[:, COL_ACCEL]
+        
+        # 3D trajectory in km, in local coordinates relative to the launch site
+        # at [R_EARTH, 0, 0]. Altitude is already recorded as |r| - R_EARTH.
+        self.traj_up = self.alt_km
+        self.traj_east = np.arctan2(hist[:, COL_Y], hist[:, COL_X]) * (R_EARTH / 1000)  # downrange
+        self.traj_north = hist[:, COL_Z] / 1000
+        
+        # Downsampled (time, value) pairs for line plots; markers and
+        # telemetry keep indexing the full-resolution arrays
+        self.alt_plot = self._plot_series(self.alt_km)
+        self.vel_plot = self._plot_series(self.vel_mag)
+        self.q_plot = self._plot_series(self.q_kpa)
+        self.accel_plot = self._plot_series(self.accel_g)
+    
+    def _plot_series(self, values):
+        """(time, values) reduced to MAX_PLOT_POINTS for line plots."""
+        idx = downsample_lttb(self.time, values)
+        return self.time[idx], values[idx]
     
     def _setup_navigation(self):
         """Create navigation buttons."""
@@ -320,6 +635,24 @@ class AscentDashboard:
         draw_func()
         self.fig.canvas.draw_idle()
     
+    def _frame_indices(self):
+        """History indices shown by the animated views (every other sample)."""
+        return np.arange(len(self.time) // 2) * 2
+    
+    def _add_telemetry_rows(self, ax_info, labels, color, label_xy, value_xy, linespacing):
+        """
+        One static multi-line Text of row labels plus one animated Text of values.
+        
+        Both blocks share font, size and linespacing so their rows keep the same
+        pitch; each is anchored at its last row's baseline.
+        """
+        text_kw = dict(transform=ax_info.transAxes, fontsize=12, linespacing=linespacing,
+                       fontfamily='monospace')
+        ax_info.text(*label_xy, "\n".join(f"► {label}" for label in labels), color=color,
+                     fontweight='bold', **text_kw)
+        return ax_info.text(*value_xy, "\n".join(["0"] * len(labels)), color='#ffffff',
+                            animated=True, **text_kw)
+    
     def _add_title(self, main, sub=""):
         t1 = self.fig.text(0.5, 0.96, f"◢ {main} ◣", fontsize=18, fontweight='bold',
                           color='#00d4ff', ha='center', fontfamily='monospace')
@@ -339,23 +672,23 @@ class AscentDashboard:
         ax4 = self.fig.add_axes([0.54, 0.12, 0.42, 0.35])
         
         style_axis_scifi(ax1, "ALTITUDE", "Time [s]", "Alt [km]")
-        ax1.plot(self.time, self.alt_km, color='#00d4ff', lw=2)
-        ax1.fill_between(self.time, 0, self.alt_km, color='#00d4ff', alpha=0.15)
+        ax1.plot(*self.alt_plot, color='#00d4ff', lw=2)
+        ax1.fill_between(self.alt_plot[0], 0, self.alt_plot[1], color='#00d4ff', alpha=0.15)
         
         style_axis_scifi(ax2, "VELOCITY", "Time [s]", "Vel [m/s]")
-        ax2.plot(self.time, self.vel_mag, color='#ff6b35', lw=2)
-        ax2.fill_between(self.time, 0, self.vel_mag, color='#ff6b35', alpha=0.15)
+        ax2.plot(*self.vel_plot, color='#ff6b35', lw=2)
+        ax2.fill_between(self.vel_plot[0], 0, self.vel_plot[1], color='#ff6b35', alpha=0.15)
         
         style_axis_scifi(ax3, "DYNAMIC PRESSURE", "Time [s]", "Q [kPa]")
-        ax3.plot(self.time, self.q_kpa, color='#ffd700', lw=2)
-        ax3.fill_between(self.time, 0, self.q_kpa, color='#ffd700', alpha=0.15)
+        ax3.plot(*self.q_plot, color='#ffd700', lw=2)
+        ax3.fill_between(self.q_plot[0], 0, self.q_plot[1], color='#ffd700', alpha=0.15)
         max_q_idx = np.argmax(self.q_kpa)
         ax3.axvline(x=self.time[max_q_idx], color='#ff3366', ls='--', lw=1.5)
         ax3.scatter([self.time[max_q_idx]], [self.q_kpa[max_q_idx]], color='#ff3366', s=80, zorder=5)
         
         style_axis_scifi(ax4, "ACCELERATION", "Time [s]", "Accel [G]")
-        ax4.plot(self.time, self.accel_g, color='#00ff9f', lw=2)
-        ax4.fill_between(self.time, 0, self.accel_g, color='#00ff9f', alpha=0.15)
+        ax4.plot(*self.accel_plot, color='#00ff9f', lw=2)
+        ax4.fill_between(self.accel_plot[0], 0, self.accel_plot[1], color='#00ff9f', alpha=0.15)
         ax4.axhline(y=3.0, color='#ff3366', ls=':', lw=1, alpha=0.7)
         ax4.text(self.time[-1]*0.7, 3.2, '3G LIMIT', color='#ff3366', fontsize=8, fontfamily='monospace')
     
@@ -365,15 +698,14 @@ class AscentDashboard:
         
         ax = self.fig.add_axes([0.08, 0.15, 0.55, 0.72])
         style_axis_scifi(ax, "ALTITUDE vs TIME", "Time [s]", "Altitude [km]")
-        ax.plot(self.time, self.alt_km, color='#00d4ff', lw=3, alpha=0.3)
-        ax.plot(self.time, self.alt_km, color='#00d4ff', lw=1.5)
-        ax.fill_between(self.time, 0, self.alt_km, color='#00d4ff', alpha=0.1)
+        glow_plot(ax, *self.alt_plot, color='#00d4ff')
+        ax.fill_between(self.alt_plot[0], 0, self.alt_plot[1], color='#00d4ff', alpha=0.1)
         
         # Reference lines
         ax.axhline(y=100, color='#ff6b35', ls='--', lw=1, alpha=0.5)
         ax.text(10, 105, 'KARMAN LINE (100km)', color='#ff6b35', fontsize=8, fontfamily='monospace')
         
-        marker, = ax.plot([], [], 'o', color='#00ff9f', markersize=14, zorder=5)
+        marker, = ax.plot([], [], 'o', color='#00ff9f', markersize=14, zorder=5, animated=True)
         
         # Info panel
         ax_info = self.fig.add_axes([0.68, 0.15, 0.28, 0.72])
@@ -390,45 +722,46 @@ class AscentDashboard:
         
         # Create text elements for live update
         time_txt = ax_info.text(0.5, 0.82, "T+ 0.0s", transform=ax_info.transAxes, fontsize=16,
-                               color='#ffd700', ha='center', fontweight='bold', fontfamily='monospace')
+                               color='#ffd700', ha='center', fontweight='bold', fontfamily='monospace',
+                               animated=True)
         
         labels = ["ALTITUDE", "VELOCITY", "ACCELERATION", "MASS"]
-        colors = ["#00d4ff", "#ff6b35", "#00ff9f", "#ffffff"]
-        value_txts = []
-        
-        for i, (label, col) in enumerate(zip(labels, colors)):
-            y = 0.68 - i * 0.15
-            ax_info.text(0.1, y, f"► {label}", transform=ax_info.transAxes, fontsize=10,
-                        color=col, fontfamily='monospace', fontweight='bold')
-            txt = ax_info.text(0.1, y - 0.06, "0", transform=ax_info.transAxes, fontsize=14,
-                              color='#ffffff', fontfamily='monospace')
-            value_txts.append(txt)
+        telem_block = self._add_telemetry_rows(ax_info, labels, '#00d4ff', (0.1, 0.23),
+                                               (0.1, 0.17), TELEM_LINESPACING)
         
         # Engine status
         engine_txt = ax_info.text(0.5, 0.12, "● ENGINE: NOMINAL", transform=ax_info.transAxes,
                                  fontsize=11, color='#00ff9f', ha='center', fontfamily='monospace',
-                                 fontweight='bold')
+                                 fontweight='bold', animated=True)
+        
+        # Per-frame strings formatted once up front; update() only indexes
+        idxs = self._frame_indices()
+        time_strs = [f"T+ {t:.1f}s" for t in self.time[idxs].tolist()]
+        telem_strs = ["\n".join(row) for row in zip(
+            [f"{a:.1f} km" for a in self.alt_km[idxs].tolist()],
+            [f"{v:.0f} m/s" for v in self.vel_mag[idxs].tolist()],
+            [f"{g:.2f} G" for g in self.accel_g[idxs].tolist()],
+            [f"{m:.0f} tonnes" for m in self.mass[idxs].tolist()],
+        )]
+        burning = (self.time[idxs] < self.sim.rocket.burn_time).tolist()
         
         def update(frame):
-            idx = (frame * 2) % len(self.time)
+            idx = idxs[frame]
             marker.set_data([self.time[idx]], [self.alt_km[idx]])
             
-            time_txt.set_text(f"T+ {self.time[idx]:.1f}s")
-            value_txts[0].set_text(f"{self.alt_km[idx]:.1f} km")
-            value_txts[1].set_text(f"{self.vel_mag[idx]:.0f} m/s")
-            value_txts[2].set_text(f"{self.accel_g[idx]:.2f} G")
-            value_txts[3].set_text(f"{self.mass[idx]:.0f} tonnes")
+            time_txt.set_text(time_strs[frame])
+            telem_block.set_text(telem_strs[frame])
             
-            if self.time[idx] < self.sim.rocket.burn_time:
+            if burning[frame]:
                 engine_txt.set_text("● ENGINE: NOMINAL")
                 engine_txt.set_color('#00ff9f')
             else:
                 engine_txt.set_text("● ENGINE: CUTOFF")
                 engine_txt.set_color('#ff6b6b')
             
-            return [marker, time_txt] + value_txts + [engine_txt]
+            return [marker, time_txt, telem_block, engine_txt]
         
-        self.anim = animation.FuncAnimation(self.fig, update, frames=len(self.time)//2,
+        self.anim = animation.FuncAnimation(self.fig, update, frames=len(idxs),
                                            interval=50, blit=True)
     
     def _draw_velocity(self):
@@ -437,18 +770,17 @@ class AscentDashboard:
         
         ax = self.fig.add_axes([0.08, 0.15, 0.55, 0.72])
         style_axis_scifi(ax, "VELOCITY vs TIME", "Time [s]", "Velocity [m/s]")
-        ax.plot(self.time, self.vel_mag, color='#ff6b35', lw=3, alpha=0.3)
-        ax.plot(self.time, self.vel_mag, color='#ff6b35', lw=1.5)
-        ax.fill_between(self.time, 0, self.vel_mag, color='#ff6b35', alpha=0.1)
+        glow_plot(ax, *self.vel_plot, color='#ff6b35')
+        ax.fill_between(self.vel_plot[0], 0, self.vel_plot[1], color='#ff6b35', alpha=0.1)
         
         # MECO marker
         meco_idx = np.searchsorted(self.time, self.sim.rocket.burn_time)
         if meco_idx < len(self.time):
             ax.axvline(x=self.sim.rocket.burn_time, color='#ff3366', ls='--', lw=2)
-            ax.text(self.sim.rocket.burn_time + 5, max(self.vel_mag)*0.5, 'MECO',
+            ax.text(self.sim.rocket.burn_time + 5, self.vel_mag.max()*0.5, 'MECO',
                    color='#ff3366', fontsize=11, fontfamily='monospace', fontweight='bold')
         
-        marker, = ax.plot([], [], 'o', color='#00ff9f', markersize=14, zorder=5)
+        marker, = ax.plot([], [], 'o', color='#00ff9f', markersize=14, zorder=5, animated=True)
         
         ax_info = self.fig.add_axes([0.68, 0.15, 0.28, 0.72])
         ax_info.set_facecolor('#050a12')
@@ -463,33 +795,32 @@ class AscentDashboard:
                     fontweight='bold', color='#ff6b35', ha='center', fontfamily='monospace')
         
         time_txt = ax_info.text(0.5, 0.82, "T+ 0.0s", transform=ax_info.transAxes, fontsize=16,
-                               color='#ffd700', ha='center', fontweight='bold', fontfamily='monospace')
+                               color='#ffd700', ha='center', fontweight='bold', fontfamily='monospace',
+                               animated=True)
         
         labels = ["VELOCITY", "MACH NUMBER", "ALTITUDE", "DOWNRANGE"]
-        colors = ["#ff6b35", "#00d4ff", "#00ff9f", "#ffffff"]
-        value_txts = []
-        
-        for i, (label, col) in enumerate(zip(labels, colors)):
-            y = 0.68 - i * 0.15
-            ax_info.text(0.1, y, f"► {label}", transform=ax_info.transAxes, fontsize=10,
-                        color=col, fontfamily='monospace', fontweight='bold')
-            txt = ax_info.text(0.1, y - 0.06, "0", transform=ax_info.transAxes, fontsize=14,
-                              color='#ffffff', fontfamily='monospace')
-            value_txts.append(txt)
+        telem_block = self._add_telemetry_rows(ax_info, labels, '#ff6b35', (0.1, 0.23),
+                                               (0.1, 0.17), TELEM_LINESPACING)
+        
+        idxs = self._frame_indices()
+        time_strs = [f"T+ {t:.1f}s" for t in self.time[idxs].tolist()]
+        telem_strs = ["\n".join(row) for row in zip(
+            [f"{v:.0f} m/s" for v in self.vel_mag[idxs].tolist()],
+            [f"Mach {v/343:.1f}" for v in self.vel_mag[idxs].tolist()],
+            [f"{a:.1f} km" for a in self.alt_km[idxs].tolist()],
+            [f"{d:.1f} km" for d in self.traj_east[idxs].tolist()],
+        )]
         
         def update(frame):
-            idx = (frame * 2) % len(self.time)
+            idx = idxs[frame]
             marker.set_data([self.time[idx]], [self.vel_mag[idx]])
             
-            time_txt.set_text(f"T+ {self.time[idx]:.1f}s")
-            value_txts[0].set_text(f"{self.vel_mag[idx]:.0f} m/s")
-            value_txts[1].set_text(f"Mach {self.vel_mag[idx]/343:.1f}")
-            value_txts[2].set_text(f"{self.alt_km[idx]:.1f} km")
-            value_txts[3].set_text(f"{self.traj_east[idx]:.1f} km")
+            time_txt.set_text(time_strs[frame])
+            telem_block.set_text(telem_strs[frame])
             
-            return [marker, time_txt] + value_txts
+            return [marker, time_txt, telem_block]
         
-        self.anim = animation.FuncAnimation(self.fig, update, frames=len(self.time)//2,
+        self.anim = animation.FuncAnimation(self.fig, update, frames=len(idxs),
                                            interval=50, blit=True)
     
     def _draw_maxq(self):
@@ -498,9 +829,8 @@ class AscentDashboard:
         
         ax = self.fig.add_axes([0.08, 0.15, 0.55, 0.72])
         style_axis_scifi(ax, "DYNAMIC PRESSURE vs TIME", "Time [s]", "Q [kPa]")
-        ax.plot(self.time, self.q_kpa, color='#ffd700', lw=3, alpha=0.3)
-        ax.plot(self.time, self.q_kpa, color='#ffd700', lw=1.5)
-        ax.fill_between(self.time, 0, self.q_kpa, color='#ffd700', alpha=0.1)
+        glow_plot(ax, *self.q_plot, color='#ffd700')
+        ax.fill_between(self.q_plot[0], 0, self.q_plot[1], color='#ffd700', alpha=0.1)
         
         max_q_idx = np.argmax(self.q_kpa)
         ax.axvline(x=self.time[max_q_idx], color='#ff3366', ls='--', lw=2)
@@ -543,8 +873,7 @@ class AscentDashboard:
         ax.set_zlabel("Cross-track [km]", color='#00d4ff', fontsize=10, fontfamily='monospace')
         
         # Plot trajectory
-        ax.plot(self.traj_east, self.traj_up, self.traj_north, color='#00d4ff', lw=3, alpha=0.3)
-        ax.plot(self.traj_east, self.traj_up, self.traj_north, color='#00d4ff', lw=1.5)
+        glow_plot(ax, self.traj_east, self.traj_up, self.traj_north, color='#00d4ff')
         
         # Launch and end markers
         ax.scatter([self.traj_east[0]], [self.traj_up[0]], [self.traj_north[0]], 
@@ -552,12 +881,20 @@ class AscentDashboard:
         ax.scatter([self.traj_east[-1]], [self.traj_up[-1]], [self.traj_north[-1]], 
                   color='#ff3366', s=100, marker='^', label='MECO')
         
-        rocket, = ax.plot([], [], [], 'o', color='#ffffff', markersize=12)
-        trail, = ax.plot([], [], [], color='#00ff9f', lw=2, alpha=0.7)
+        rocket, = ax.plot([], [], [], 'o', color='#ffffff', markersize=12, animated=True)
+        
+        # Trail segments between the animated samples are built once; each frame
+        # only reveals the flown prefix by setting per-segment alpha
+        idxs = self._frame_indices()
+        pts = np.column_stack([self.traj_east, self.traj_up, self.traj_north])[idxs]
+        trail_rgba = np.tile(to_rgba('#00ff9f', 0.0), (max(len(pts) - 1, 0), 1))
+        trail = Line3DCollection(np.stack([pts[:-1], pts[1:]], axis=1),
+                                 colors=trail_rgba, linewidths=2, animated=True)
+        ax.add_collection3d(trail, autolim=False)
         
-        ax.set_xlim(min(self.traj_east)-10, max(self.traj_east)+10)
-        ax.set_ylim(0, max(self.traj_up)*1.1)
-        ax.set_zlim(min(self.traj_north)-5, max(self.traj_north)+5)
+        ax.set_xlim(self.traj_east.min()-10, self.traj_east.max()+10)
+        ax.set_ylim(0, self.traj_up.max()*1.1)
+        ax.set_zlim(self.traj_north.min()-5, self.traj_north.max()+5)
         
         ax.legend(loc='upper left', facecolor='#0a1420', labelcolor='white', fontsize=9)
         ax.view_init(elev=15, azim=-60)
@@ -576,62 +913,67 @@ class AscentDashboard:
                     fontweight='bold', color='#00d4ff', ha='center', fontfamily='monospace')
         
         time_txt = ax_info.text(0.5, 0.88, "T+ 0.0s", transform=ax_info.transAxes, fontsize=18,
-                               color='#ffd700', ha='center', fontweight='bold', fontfamily='monospace')
+                               color='#ffd700', ha='center', fontweight='bold', fontfamily='monospace',
+                               animated=True)
         
         labels = ["ALTITUDE", "VELOCITY", "DOWNRANGE", "ACCELERATION", "MASS"]
-        colors = ["#00d4ff", "#ff6b35", "#00ff9f", "#ffd700", "#ffffff"]
-        value_txts = []
-        
-        for i, (label, col) in enumerate(zip(labels, colors)):
-            y = 0.76 - i * 0.12
-            ax_info.text(0.08, y, f"► {label}", transform=ax_info.transAxes, fontsize=10,
-                        color=col, fontfamily='monospace', fontweight='bold')
-            txt = ax_info.text(0.55, y, "0", transform=ax_info.transAxes, fontsize=12,
-                              color='#ffffff', fontfamily='monospace', ha='left')
-            value_txts.append(txt)
+        telem_block = self._add_telemetry_rows(ax_info, labels, '#00d4ff', (0.08, 0.28),
+                                               (0.55, 0.28), TELEM_3D_LINESPACING)
         
         engine_txt = ax_info.text(0.5, 0.12, "● ENGINE: NOMINAL", transform=ax_info.transAxes,
                                  fontsize=12, color='#00ff9f', ha='center', fontfamily='monospace',
-                                 fontweight='bold')
+                                 fontweight='bold', animated=True)
         
         phase_txt = ax_info.text(0.5, 0.05, "VERTICAL ASCENT", transform=ax_info.transAxes,
-                                fontsize=10, color='#7fdbff', ha='center', fontfamily='monospace')
+                                fontsize=10, color='#7fdbff', ha='center', fontfamily='monospace',
+                                animated=True)
+        
+        time_strs = [f"T+ {t:.1f}s" for t in self.time[idxs].tolist()]
+        telem_strs = ["\n".join(row) for row in zip(
+            [f"{a:.1f} km" for a in self.alt_km[idxs].tolist()],
+            [f"{v:.0f} m/s" for v in self.vel_mag[idxs].tolist()],
+            [f"{d:.1f} km" for d in self.traj_east[idxs].tolist()],
+            [f"{g:.2f} G" for g in self.accel_g[idxs].tolist()],
+            [f"{m:.0f} t" for m in self.mass[idxs].tolist()],
+        )]
+        
+        def flight_phase(t):
+            if t >= self.sim.rocket.burn_time:
+                return "COAST PHASE"
+            if t < 10:
+                return "VERTICAL ASCENT"
+            if t < 60:
+                return "GRAVITY TURN"
+            return "POWERED FLIGHT"
+        
+        phase_strs = [flight_phase(t) for t in self.time[idxs].tolist()]
+        burning = (self.time[idxs] < self.sim.rocket.burn_time).tolist()
         
         def update(frame):
-            idx = (frame * 2) % len(self.time)
+            idx = idxs[frame]
             
             rocket.set_data([self.traj_east[idx]], [self.traj_up[idx]])
             rocket.set_3d_properties([self.traj_north[idx]])
             
-            trail.set_data(self.traj_east[:idx+1], self.traj_up[:idx+1])
-            trail.set_3d_properties(self.traj_north[:idx+1])
+            trail_rgba[:frame, 3] = 0.7
+            trail_rgba[frame:, 3] = 0.0
+            trail.set_color(trail_rgba)
             
-            time_txt.set_text(f"T+ {self.time[idx]:.1f}s")
-            value_txts[0].set_text(f"{self.alt_km[idx]:.1f} km")
-            value_txts[1].set_text(f"{self.vel_mag[idx]:.0f} m/s")
-            value_txts[2].set_text(f"{self.traj_east[idx]:.1f} km")
-            value_txts[3].set_text(f"{self.accel_g[idx]:.2f} G")
-            value_txts[4].set_text(f"{self.mass[idx]:.0f} t")
+            time_txt.set_text(time_strs[frame])
+            telem_block.set_text(telem_strs[frame])
             
-            t = self.time[idx]
-            if t < self.sim.rocket.burn_time:
+            if burning[frame]:
                 engine_txt.set_text("● ENGINE: NOMINAL")
                 engine_txt.set_color('#00ff9f')
-                if t < 10:
-                    phase_txt.set_text("VERTICAL ASCENT")
-                elif t < 60:
-                    phase_txt.set_text("GRAVITY TURN")
-                else:
-                    phase_txt.set_text("POWERED FLIGHT")
             else:
                 engine_txt.set_text("● ENGINE: CUTOFF")
                 engine_txt.set_color('#ff6b6b')
-                phase_txt.set_text("COAST PHASE")
+            phase_txt.set_text(phase_strs[frame])
             
-            return [rocket, trail, time_txt, engine_txt, phase_txt] + value_txts
+            return [rocket, trail, time_txt, telem_block, engine_txt, phase_txt]
         
-        self.anim = animation.FuncAnimation(self.fig, update, frames=len(self.time)//2,
-                                           interval=50, blit=False)
+        self.anim = animation.FuncAnimation(self.fig, update, frames=len(idxs),
+                                           interval=50, blit=True)
     
     def show(self):
         plt.show()
@@ -6,14 +6,29 @@ Propagates satellite orbits with J2 perturbation physics.
 Visualizes constellation coverage with real Starlink parameters.
 """
 
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 from matplotlib.widgets import Button
 from matplotlib.patches import FancyBboxPatch, Circle
 from matplotlib.lines import Line2D
+from matplotlib.collections import LineCollection
 from dataclasses import dataclass
 
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional; simulate() then uses the NumPy path
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+    prange = range
+    HAVE_NUMBA = False
+
 # --- Constants (WGS84 / EGM96) ---
 G = 6.67430e-11
 M_EARTH = 5.972e24
@@ -22,6 +37,14 @@ J2 = 1.08263e-3
 MU = G * M_EARTH
 OMEGA_EARTH = 7.2921159e-5
 
+# Newton iteration on Kepler's equation M = E - e*sin(E)
+KEPLER_TOL = 1e-12   # [rad]
+KEPLER_MAX_ITER = 20
+
+# Without Numba, runs of at least this many (satellite, step) samples are split
+# across a process pool; below it, process start-up outweighs the gain
+POOL_MIN_SAMPLES = 2_000_000
+
 # Global constellation data from multiple space agencies
 CONSTELLATION_DATABASE = {
     'starlink': {
@@ -137,6 +160,39 @@ class Satellite:
     color: str = '#00d4ff'
 
 
+@dataclass(eq=False)
+class ConstellationArray:
+    """Structure-of-arrays block of satellites, one (N,) array per element.
+    
+    Indexing and iteration yield Satellite records, so it can stand in for
+    a list of satellites.
+    """
+    name: np.ndarray
+    a: np.ndarray
+    e: np.ndarray
+    i: np.ndarray
+    raan: np.ndarray
+    arg_p: np.ndarray
+    nu: np.ndarray
+    color: np.ndarray
+    
+    @classmethod
+    def from_satellites(cls, satellites) -> 'ConstellationArray':
+        return cls(*(np.array([getattr(sat, f) for sat in satellites])
+                     for f in ('name', 'a', 'e', 'i', 'raan', 'arg_p', 'nu', 'color')))
+    
+    def __len__(self):
+        return len(self.a)
+    
+    def __getitem__(self, k) -> Satellite:
+        return Satellite(str(self.name[k]), float(self.a[k]), float(self.e[k]), float(self.i[k]),
+                         float(self.raan[k]), float(self.arg_p[k]), float(self.nu[k]),
+                         str(self.color[k]))
+    
+    def __iter__(self):
+        return (self[k] for k in range(len(self)))
+
+
 class Propagator:
     """J2 perturbation propagator."""
     
@@ -150,72 +206,265 @@ class Propagator:
         return raan_dot, arg_p_dot
 
     @staticmethod
-    def coe_to_rv(a, e, i, raan, arg_p, nu):
-        """COEs to ECI position vector."""
+    def mean_anomaly(nu, e):
+        """True -> mean anomaly (rad), via the eccentric anomaly."""
+        E = 2 * np.arctan2(np.sqrt(1 - e) * np.sin(nu / 2), np.sqrt(1 + e) * np.cos(nu / 2))
+        return E - e * np.sin(E)
+    
+    @staticmethod
+    def solve_kepler(M, e):
+        """Eccentric anomaly for mean anomaly M (Newton, broadcast over arrays)."""
+        E = M + e * np.sin(M)
+        for _ in range(KEPLER_MAX_ITER):
+            dE = (E - e * np.sin(E) - M) / (1 - e * np.cos(E))
+            E = E - dE
+            if np.all(np.abs(dE) < KEPLER_TOL):
+                break
+        return E
+    
+    @staticmethod
+    def true_anomaly(E, e):
+        """Eccentric -> true anomaly (rad)."""
+        return 2 * np.arctan2(np.sqrt(1 + e) * np.sin(E / 2), np.sqrt(1 - e) * np.cos(E / 2))
+    
+    @staticmethod
+    def _pqw(a, e, nu):
+        """Perifocal (PQW) position vector, components along the leading axis."""
         r_mag = a * (1 - e**2) / (1 + e * np.cos(nu))
-        r_pqw = np.array([r_mag * np.cos(nu), r_mag * np.sin(nu), 0])
-        
+        return np.array([r_mag * np.cos(nu), r_mag * np.sin(nu), np.zeros_like(r_mag)])
+    
+    @staticmethod
+    def _rot_pqw_to_eci(i, raan, arg_p):
+        """PQW -> ECI rotation matrix, shape (3, 3) + broadcast shape of the angles."""
         cO, sO = np.cos(raan), np.sin(raan)
         ci, si = np.cos(i), np.sin(i)
         cw, sw = np.cos(arg_p), np.sin(arg_p)
         
-        R = np.array([
-            [cO*cw - sO*ci*sw, -cO*sw - sO*ci*cw,  sO*si],
-            [sO*cw + cO*ci*sw, -sO*sw + cO*ci*cw, -cO*si],
-            [si*sw,             si*cw,             ci]
-        ])
-        return R @ r_pqw
+        R = np.array(np.broadcast_arrays(
+            cO*cw - sO*ci*sw, -cO*sw - sO*ci*cw,  sO*si,
+            sO*cw + cO*ci*sw, -sO*sw + cO*ci*cw, -cO*si,
+            si*sw,             si*cw,             ci
+        ))
+        return R.reshape((3, 3) + R.shape[1:])
+    
+    @staticmethod
+    def coe_to_rv(a, e, i, raan, arg_p, nu):
+        """COEs to ECI position vector.
+
+        Elements may be scalars or broadcastable arrays; the x/y/z components
+        are stacked along the trailing axis, shape (..., 3), as eci_to_lla expects.
+        """
+        R = Propagator._rot_pqw_to_eci(i, raan, arg_p)
+        return np.einsum('ij...,j...->...i', R, Propagator._pqw(a, e, nu))
     
     @staticmethod
     def eci_to_lla(r_eci, time):
-        """ECI to Lat/Lon/Alt."""
-        x, y, z = r_eci
-        r_mag = np.linalg.norm(r_eci)
-        lat = np.arcsin(z / r_mag)
-        lon_eci = np.arctan2(y, x)
+        """ECI to Lat/Lon/Alt.
+        
+        r_eci is a (3,) vector or a (..., 3) array of positions with x/y/z on
+        the trailing axis, as coe_to_rv returns them; time broadcasts against
+        the leading shape.
+        """
+        r_mag = np.linalg.norm(r_eci, axis=-1)
+        lat = np.arcsin(r_eci[..., 2] / r_mag)
+        lon_eci = np.arctan2(r_eci[..., 1], r_eci[..., 0])
         gmst = OMEGA_EARTH * time
         lon = np.arctan2(np.sin(lon_eci - gmst), np.cos(lon_eci - gmst))
         alt = r_mag - R_EARTH
         return np.degrees(lat), np.degrees(lon), alt
 
 
+def _propagate_numpy(a, e, inc, raan0, arg_p0, M0, raan_dot, arg_p_dot, n, t):
+    """Vectorized propagation of (N,) element arrays over the (T,) time grid.
+
+    M0 is the epoch mean anomaly; raan_dot, arg_p_dot and n are the
+    per-satellite secular rates [rad/s].
+
+    Returns ECI positions (N, T, 3) [km], latitude/longitude (N, T, 2) [deg]
+    and speed (N, T) [km/s].
+    """
+    a, e, inc = a[:, None], e[:, None], inc[:, None]
+    raan = raan0[:, None] + raan_dot[:, None] * t
+    arg_p = arg_p0[:, None] + arg_p_dot[:, None] * t
+    M = M0[:, None] + n[:, None] * t
+    nu = Propagator.true_anomaly(Propagator.solve_kepler(M, e), e)
+    
+    # The PQW vector has no W component, so only the first two columns of
+    # the (3, 3, N, T) rotation take part in the contraction
+    r_pqw = Propagator._pqw(a, e, nu)[:2]
+    R = Propagator._rot_pqw_to_eci(inc, raan, arg_p)[:, :2]
+    pos = np.einsum('ij...,j...->...i', R, r_pqw, order='C')   # (N, T, 3) [m]
+    lat, lon, _ = Propagator.eci_to_lla(pos, t)
+    
+    # Velocity magnitude (vis-viva); the rotation preserves |r|
+    r = np.hypot(r_pqw[0], r_pqw[1])
+    v = np.sqrt(MU * (2/r - 1/a)) / 1000  # km/s
+    
+    pos /= 1000.0
+    return pos, np.stack((lat, lon), axis=-1), v
+
+
+def _propagate_pooled(elements, t, workers):
+    """Run _propagate_numpy on satellite blocks in worker processes.
+    
+    Satellites are independent, so the (N,) element arrays are split into
+    one contiguous block per worker and the results concatenated in order.
+    """
+    bounds = np.linspace(0, len(elements[0]), workers + 1).astype(int)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_propagate_numpy, *(x[lo:hi] for x in elements), t)
+                   for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+        parts = [f.result() for f in futures]
+    return tuple(np.concatenate(arrays) for arrays in zip(*parts))
+
+
+@njit(cache=True, fastmath=True)
+def _solve_kepler(M, e):
+    """Scalar Newton solve of Kepler's equation for the eccentric anomaly."""
+    E = M + e * math.sin(M)
+    for _ in range(KEPLER_MAX_ITER):
+        dE = (E - e * math.sin(E) - M) / (1 - e * math.cos(E))
+        E -= dE
+        if abs(dE) < KEPLER_TOL:
+            break
+    return E
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _propagate_all(a, e, inc, raan0, arg_p0, M0, raan_dot, arg_p_dot, n, steps, dt):
+    """Compiled counterpart of _propagate_numpy, parallel over satellites."""
+    n_sat = a.shape[0]
+    pos = np.empty((n_sat, steps, 3))
+    lla = np.empty((n_sat, steps, 2))
+    v = np.empty((n_sat, steps))
+    
+    for k in prange(n_sat):
+        b = a[k] * math.sqrt(1 - e[k]**2)
+        ci, si = math.cos(inc[k]), math.sin(inc[k])
+        
+        for s in range(steps):
+            t = s * dt
+            raan = raan0[k] + raan_dot[k] * t
+            arg_p = arg_p0[k] + arg_p_dot[k] * t
+            E = _solve_kepler(M0[k] + n[k] * t, e[k])
+            
+            # Perifocal position straight from the eccentric anomaly
+            cE, sE = math.cos(E), math.sin(E)
+            r_mag = a[k] * (1 - e[k] * cE)
+            xp, yp = a[k] * (cE - e[k]), b * sE
+            
+            cO, sO = math.cos(raan), math.sin(raan)
+            cw, sw = math.cos(arg_p), math.sin(arg_p)
+            x = (cO*cw - sO*ci*sw) * xp + (-cO*sw - sO*ci*cw) * yp
+            y = (sO*cw + cO*ci*sw) * xp + (-sO*sw + cO*ci*cw) * yp
+            z = si*sw * xp + si*cw * yp
+            
+            pos[k, s, 0] = x / 1000.0
+            pos[k, s, 1] = y / 1000.0
+            pos[k, s, 2] = z / 1000.0
+            
+            # |r| is r_mag since the PQW->ECI rotation is orthonormal
+            lla[k, s, 0] = math.degrees(math.asin(z / r_mag))
+            d_lon = math.atan2(y, x) - OMEGA_EARTH * t
+            lla[k, s, 1] = math.degrees(math.atan2(math.sin(d_lon), math.cos(d_lon)))
+            v[k, s] = math.sqrt(MU * (2 / r_mag - 1 / a[k])) / 1000  # km/s
+    
+    return pos, lla, v
+
+
+@njit(cache=True, fastmath=True, parallel=True)
+def _propagate_circular(a, inc, raan0, u0, raan_dot, u_dot, steps, dt):
+    """_propagate_all specialized to e = 0.
+    
+    A circular orbit's position depends on arg_p and nu only through the
+    argument of latitude u = arg_p + nu, so the argument-of-perigee drift is
+    folded into u_dot and there is no Kepler solve, radius or speed update.
+    """
+    n_sat = a.shape[0]
+    pos = np.empty((n_sat, steps, 3))
+    lla = np.empty((n_sat, steps, 2))
+    v = np.empty((n_sat, steps))
+    
+    for k in prange(n_sat):
+        r_km = a[k] / 1000.0
+        ci, si = math.cos(inc[k]), math.sin(inc[k])
+        v[k, :] = math.sqrt(MU / a[k]) / 1000  # km/s
+        
+        for s in range(steps):
+            t = s * dt
+            raan = raan0[k] + raan_dot[k] * t
+            u = u0[k] + u_dot[k] * t
+            
+            cO, sO = math.cos(raan), math.sin(raan)
+            cu, su = math.cos(u), math.sin(u)
+            x = r_km * (cO*cu - sO*ci*su)
+            y = r_km * (sO*cu + cO*ci*su)
+            z = r_km * si * su
+            
+            pos[k, s, 0] = x
+            pos[k, s, 1] = y
+            pos[k, s, 2] = z
+            
+            lla[k, s, 0] = math.degrees(math.asin(si * su))
+            d_lon = math.atan2(y, x) - OMEGA_EARTH * t
+            lla[k, s, 1] = math.degrees(math.atan2(math.sin(d_lon), math.cos(d_lon)))
+    
+    return pos, lla, v
+
+
 class ConstellationSimulator:
-    """Simulates and stores constellation state."""
+    """Simulates and stores constellation state.
+    
+    State is kept as structure-of-arrays indexed [satellite, step]:
+    pos (N, T, 3) ECI [km], lla (N, T, 2) lat/lon [deg] and v (N, T) [km/s].
+    """
     
-    def __init__(self, satellites: list):
+    def __init__(self, satellites):
+        if not isinstance(satellites, ConstellationArray):
+            satellites = ConstellationArray.from_satellites(satellites)
         self.satellites = satellites
-        self.history = {sat.name: {'x': [], 'y': [], 'z': [], 'lat': [], 'lon': [], 'v': []} 
-                       for sat in satellites}
+        n_sat = len(satellites)
+        self.pos = np.empty((n_sat, 0, 3))
+        self.lla = np.empty((n_sat, 0, 2))
+        self.v = np.empty((n_sat, 0))
         self.dt = 10.0
+    
+    @property
+    def history(self) -> dict:
+        """Per-satellite views of the state arrays, keyed by satellite name."""
+        return {
+            str(name): {'x': self.pos[k, :, 0], 'y': self.pos[k, :, 1], 'z': self.pos[k, :, 2],
+                        'lat': self.lla[k, :, 0], 'lon': self.lla[k, :, 1], 'v': self.v[k]}
+            for k, name in enumerate(self.satellites.name)
+        }
         
     def simulate(self, duration: float, dt: float):
+        """Propagate every satellite over the whole time grid in one pass."""
         self.dt = dt
         steps = int(duration / dt)
         
-        for step in range(steps):
-            time = step * dt
-            
-            for sat in self.satellites:
-                raan_dot, arg_p_dot = Propagator.j2_rates(sat.a, sat.e, sat.i)
-                current_raan = sat.raan + raan_dot * time
-                current_arg_p = sat.arg_p + arg_p_dot * time
-                n = np.sqrt(MU / sat.a**3)
-                current_nu = sat.nu + n * time
-                
-                r_eci = Propagator.coe_to_rv(sat.a, sat.e, sat.i, current_raan, current_arg_p, current_nu)
-                
-                self.history[sat.name]['x'].append(r_eci[0] / 1000.0)
-                self.history[sat.name]['y'].append(r_eci[1] / 1000.0)
-                self.history[sat.name]['z'].append(r_eci[2] / 1000.0)
-                
-                lat, lon, _ = Propagator.eci_to_lla(r_eci, time)
-                self.history[sat.name]['lat'].append(lat)
-                self.history[sat.name]['lon'].append(lon)
-                
-                # Velocity magnitude (vis-viva)
-                r = np.linalg.norm(r_eci)
-                v = np.sqrt(MU * (2/r - 1/sat.a)) / 1000  # km/s
-                self.history[sat.name]['v'].append(v)
+        sats = self.satellites
+        a, e, inc = sats.a, sats.e, sats.i
+        raan0, arg_p0 = sats.raan, sats.arg_p
+        M0 = Propagator.mean_anomaly(sats.nu, e)
+        
+        # Secular rates depend only on (a, e, i): evaluate once per satellite
+        raan_dot, arg_p_dot = Propagator.j2_rates(a, e, inc)
+        n = np.sqrt(MU / a**3)
+        
+        elements = (a, e, inc, raan0, arg_p0, M0, raan_dot, arg_p_dot, n)
+        if HAVE_NUMBA and not e.any():
+            self.pos, self.lla, self.v = _propagate_circular(
+                a, inc, raan0, arg_p0 + M0, raan_dot, n + arg_p_dot, steps, dt)
+        elif HAVE_NUMBA:
+            self.pos, self.lla, self.v = _propagate_all(*elements, steps, dt)
+        else:
+            t = np.arange(steps) * dt
+            workers = os.cpu_count() or 1
+            if workers > 1 and len(a) * steps >= POOL_MIN_SAMPLES:
+                self.pos, self.lla, self.v = _propagate_pooled(elements, t, workers)
+            else:
+                self.pos, self.lla, self.v = _propagate_numpy(*elements, t)
 
 
 class ConstellationDashboard:
@@ -223,6 +472,21 @@ class ConstellationDashboard:
     
     def __init__(self, sim: ConstellationSimulator):
         self.sim = sim
+        # km-scale plotting needs no float64: cast the propagated state once
+        self.pos_f32 = sim.pos.astype(np.float32)
+        self.lla_f32 = sim.lla.astype(np.float32)
+        
+        # Clock labels for every step, formatted once instead of per frame
+        self.sim_times = np.arange(sim.pos.shape[1]) * sim.dt
+        self._tlabels = [f"T+ {int(t // 3600):02d}:{int((t % 3600) // 60):02d}:{int(t % 60):02d}"
+                         for t in self.sim_times]
+        self._tlabels_ms = [f"T+ {int(t // 60):02d}:{int(t % 60):02d}" for t in self.sim_times]
+        
+        # Orbit invariants of the lead satellite shown in the panels
+        a0 = sim.satellites.a[0]
+        self._period = 2 * np.pi * np.sqrt(a0**3 / MU)   # [s]
+        self._v_orb = np.sqrt(MU / a0) / 1000            # [km/s]
+        
         self.current_view = 0
         self.views = [
             ("3D VIEW", self._draw_3d),
@@ -238,7 +502,23 @@ class ConstellationDashboard:
         self.button_axes = []
         self.anim = None
         
+        # Every view is drawn once into persistent artists that are then only
+        # hidden/shown: view index -> (axes and figure texts, animation spec)
+        self._axes_by_view = {}
+        self._anim_spec = None
+        self._shown_view = None
+        
+        # Low-poly Earth mesh shared by every 3D draw; the 3D axes depth-sorts
+        # each facet in Python on every redraw, so keep the facet count small
+        u = np.linspace(0, 2*np.pi, 12)
+        v = np.linspace(0, np.pi, 12)
+        r_km = R_EARTH / 1000
+        self._earth_xyz = (r_km * np.outer(np.cos(u), np.sin(v)),
+                           r_km * np.outer(np.sin(u), np.sin(v)),
+                           r_km * np.outer(np.ones(len(u)), np.cos(v)))
+        
         self._setup_navigation()
+        self._build_views()
         self._draw_current_view()
     
     def _setup_navigation(self):
@@ -266,18 +546,33 @@ class ConstellationDashboard:
         self.current_view = idx
         self._draw_current_view()
     
+    def _build_views(self):
+        """Draw every view once into its own hidden set of axes and figure texts."""
+        for idx, (_, draw_func) in enumerate(self.views):
+            existing_axes = set(self.fig.axes)
+            self._anim_spec = None
+            draw_func()
+            artists = [ax for ax in self.fig.axes if ax not in existing_axes] + self.fig_texts
+            for artist in artists:
+                artist.set_visible(False)
+            self._axes_by_view[idx] = (artists, self._anim_spec)
+            self.fig_texts = []
+    
     def _clear_view(self):
+        # A hidden view's animation is dropped rather than paused: a paused
+        # blitting animation restarts itself after a canvas resize
         if self.anim is not None:
             self.anim.event_source.stop()
             self.anim = None
-        for ax in [a for a in self.fig.axes if a not in self.button_axes]:
-            ax.remove()
-        for txt in self.fig_texts:
-            try:
-                txt.remove()
-            except:
-                pass
-        self.fig_texts.clear()
+        if self._shown_view is not None:
+            artists, _ = self._axes_by_view[self._shown_view]
+            for artist in artists:
+                artist.set_visible(False)
+            self._shown_view = None
+    
+    def _animate(self, update, frames, interval):
+        """Register the animation of the view being drawn."""
+        self._anim_spec = (update, frames, interval)
     
     def _draw_current_view(self):
         self._clear_view()
@@ -290,8 +585,15 @@ class ConstellationDashboard:
                 btn.ax.set_facecolor('#0a1628')
                 for spine in btn.ax.spines.values():
                     spine.set_color('#00d4ff')
-        _, draw_func = self.views[self.current_view]
-        draw_func()
+        
+        artists, anim_spec = self._axes_by_view[self.current_view]
+        for artist in artists:
+            artist.set_visible(True)
+        if anim_spec is not None:
+            update, frames, interval = anim_spec
+            self.anim = animation.FuncAnimation(self.fig, update, frames=frames,
+                                               interval=interval, blit=True)
+        self._shown_view = self.current_view
         self.fig.canvas.draw_idle()
     
     def _add_title(self, main, sub=""):
@@ -312,19 +614,16 @@ class ConstellationDashboard:
         ax.set_zlabel("Z [km]", color='#00d4ff', fontsize=10, fontfamily='monospace')
         
         # Earth sphere
-        u = np.linspace(0, 2*np.pi, 50)
-        v = np.linspace(0, np.pi, 50)
         r_km = R_EARTH / 1000
-        x_e = r_km * np.outer(np.cos(u), np.sin(v))
-        y_e = r_km * np.outer(np.sin(u), np.sin(v))
-        z_e = r_km * np.outer(np.ones(len(u)), np.cos(v))
-        ax.plot_surface(x_e, y_e, z_e, color='#1a4a6e', alpha=0.6, rstride=3, cstride=3)
+        ax.plot_surface(*self._earth_xyz, color='#1a4a6e', alpha=0.6, rstride=1, cstride=1,
+                        shade=False)
         
         # Satellite trails and markers
         lines, markers = [], []
         for sat in self.sim.satellites:
-            line, = ax.plot([], [], [], color=sat.color, lw=1.5, alpha=0.6)
-            marker, = ax.plot([], [], [], 'o', color='white', markeredgecolor=sat.color, markersize=5)
+            line, = ax.plot([], [], [], color=sat.color, lw=1.5, alpha=0.6, animated=True)
+            marker, = ax.plot([], [], [], 'o', color='white', markeredgecolor=sat.color,
+                              markersize=5, animated=True)
             lines.append(line)
             markers.append(marker)
         
@@ -350,13 +649,13 @@ class ConstellationDashboard:
         
         time_txt = ax_info.text(0.5, 0.88, "T+ 00:00:00", transform=ax_info.transAxes,
                                fontsize=14, color='#ffd700', ha='center', fontweight='bold',
-                               fontfamily='monospace')
+                               fontfamily='monospace', animated=True)
         
         # Static constellation info
         sat = self.sim.satellites[0]
         alt_km = (sat.a - R_EARTH) / 1000
-        period_min = 2 * np.pi * np.sqrt(sat.a**3 / MU) / 60
-        v_orbital = np.sqrt(MU / sat.a) / 1000
+        period_min = self._period / 60
+        v_orbital = self._v_orb
         
         info = [
             ("► SATELLITES", f"{len(self.sim.satellites)}", "#00d4ff"),
@@ -391,31 +690,28 @@ class ConstellationDashboard:
         ax_info.text(0.55, 0.12, "Westward", transform=ax_info.transAxes,
                     fontsize=10, color='#ff6b35', fontfamily='monospace')
         
+        pos = self.pos_f32
+        n_steps = pos.shape[1]
+        animated_artists = lines + markers + [time_txt]
+        
         def update(frame):
-            idx = (frame * 5) % len(self.sim.history[self.sim.satellites[0].name]['x'])
+            idx = (frame * 5) % n_steps
             
-            sim_time = idx * self.sim.dt
-            h = int(sim_time // 3600)
-            m = int((sim_time % 3600) // 60)
-            s = int(sim_time % 60)
-            time_txt.set_text(f"T+ {h:02d}:{m:02d}:{s:02d}")
+            time_txt.set_text(self._tlabels[idx])
             
-            for i, sat in enumerate(self.sim.satellites):
-                hist = self.sim.history[sat.name]
-                trail_len = 200
-                start = max(0, idx - trail_len)
+            trail_len = 200
+            start = max(0, idx - trail_len)
+            for i in range(len(self.sim.satellites)):
+                lines[i].set_data(pos[i, start:idx, 0], pos[i, start:idx, 1])
+                lines[i].set_3d_properties(pos[i, start:idx, 2])
                 
-                lines[i].set_data(hist['x'][start:idx], hist['y'][start:idx])
-                lines[i].set_3d_properties(hist['z'][start:idx])
-                
-                markers[i].set_data([hist['x'][idx]], [hist['y'][idx]])
-                markers[i].set_3d_properties([hist['z'][idx]])
+                markers[i].set_data(pos[i, idx:idx+1, 0], pos[i, idx:idx+1, 1])
+                markers[i].set_3d_properties(pos[i, idx:idx+1, 2])
             
-            return lines + markers + [time_txt]
+            return animated_artists
         
-        frames = len(self.sim.history[self.sim.satellites[0].name]['x']) // 5
-        self.anim = animation.FuncAnimation(self.fig, update, frames=frames,
-                                           interval=30, blit=False)
+        frames = n_steps // 5
+        self._animate(update, frames, interval=30)
     
     def _draw_ground_track(self):
         """Ground track projection."""
@@ -432,25 +728,28 @@ class ConstellationDashboard:
         
         ax.axhline(0, color='#ff6b35', alpha=0.3, lw=1)  # Equator
         
-        # Plot all tracks
-        for sat in self.sim.satellites:
-            hist = self.sim.history[sat.name]
-            lats = np.array(hist['lat'])
-            lons = np.array(hist['lon'])
+        # Plot all tracks as one collection
+        lla = self.lla_f32
+        n_steps = lla.shape[1]
+        segs, seg_colors = [], []
+        for k, sat in enumerate(self.sim.satellites):
+            lon_lat = lla[k, :, ::-1]
             
             # Break at discontinuities
-            lon_diff = np.abs(np.diff(lons))
+            lon_diff = np.abs(np.diff(lon_lat[:, 0]))
             breaks = np.where(lon_diff > 180)[0] + 1
             
-            for seg_lat, seg_lon in zip(np.split(lats, breaks), np.split(lons, breaks)):
-                if len(seg_lat) > 1:
-                    ax.plot(seg_lon, seg_lat, color=sat.color, alpha=0.4, lw=1)
+            for seg in np.split(lon_lat, breaks):
+                if len(seg) > 1:
+                    segs.append(seg)
+                    seg_colors.append(sat.color)
+        ax.add_collection(LineCollection(segs, colors=seg_colors, alpha=0.4, lw=1))
         
         # Current positions
         markers = []
         for sat in self.sim.satellites:
             marker, = ax.plot([], [], 'o', color=sat.color, markersize=8,
-                             markeredgecolor='white', markeredgewidth=1)
+                             markeredgecolor='white', markeredgewidth=1, animated=True)
             markers.append(marker)
         
         ax.set_xlim(-180, 180)
@@ -472,7 +771,7 @@ class ConstellationDashboard:
         
         time_txt = ax_info.text(0.5, 0.88, "T+ 00:00", transform=ax_info.transAxes,
                                fontsize=13, color='#ffd700', ha='center', fontweight='bold',
-                               fontfamily='monospace')
+                               fontfamily='monospace', animated=True)
         
         # Live telemetry for first sat
         labels = ["SAT-0-0 LAT", "SAT-0-0 LON", "COVERAGE", "ORBITS COMPLETE"]
@@ -484,41 +783,38 @@ class ConstellationDashboard:
             ax_info.text(0.08, y, f"► {label}", transform=ax_info.transAxes, fontsize=9,
                         color=col, fontfamily='monospace', fontweight='bold')
             txt = ax_info.text(0.08, y - 0.05, "---", transform=ax_info.transAxes,
-                              fontsize=11, color='#ffffff', fontfamily='monospace')
+                              fontsize=11, color='#ffffff', fontfamily='monospace',
+                              animated=True)
             value_txts.append(txt)
         
+        animated_artists = markers + [time_txt] + value_txts
+        
+        n_sats = len(self.sim.satellites)
+        
         def update(frame):
-            idx = (frame * 5) % len(self.sim.history[self.sim.satellites[0].name]['lat'])
+            idx = (frame * 5) % n_steps
             
-            sim_time = idx * self.sim.dt
-            m = int(sim_time // 60)
-            s = int(sim_time % 60)
-            time_txt.set_text(f"T+ {m:02d}:{s:02d}")
+            time_txt.set_text(self._tlabels_ms[idx])
             
-            for i, sat in enumerate(self.sim.satellites):
-                hist = self.sim.history[sat.name]
-                markers[i].set_data([hist['lon'][idx]], [hist['lat'][idx]])
+            for i in range(n_sats):
+                markers[i].set_data(lla[i, idx:idx+1, 1], lla[i, idx:idx+1, 0])
             
             # Update telemetry
-            hist0 = self.sim.history[self.sim.satellites[0].name]
-            value_txts[0].set_text(f"{hist0['lat'][idx]:.2f}°")
-            value_txts[1].set_text(f"{hist0['lon'][idx]:.2f}°")
+            value_txts[0].set_text(f"{lla[0, idx, 0]:.2f}°")
+            value_txts[1].set_text(f"{lla[0, idx, 1]:.2f}°")
             
             # Coverage estimate (simplified)
-            coverage_pct = min(100, (len(self.sim.satellites) * 0.5) + (idx * 0.001))
+            coverage_pct = min(100, (n_sats * 0.5) + (idx * 0.001))
             value_txts[2].set_text(f"~{coverage_pct:.0f}%")
             
             # Orbits complete
-            sat = self.sim.satellites[0]
-            period = 2 * np.pi * np.sqrt(sat.a**3 / MU)
-            orbits = sim_time / period
+            orbits = self.sim_times[idx] / self._period
             value_txts[3].set_text(f"{orbits:.2f}")
             
-            return markers + [time_txt] + value_txts
+            return animated_artists
         
-        frames = len(self.sim.history[self.sim.satellites[0].name]['lat']) // 5
-        self.anim = animation.FuncAnimation(self.fig, update, frames=frames,
-                                           interval=50, blit=True)
+        frames = n_steps // 5
+        self._animate(update, frames, interval=50)
     
     def _draw_coverage(self):
         """Coverage analysis view."""
@@ -530,19 +826,17 @@ class ConstellationDashboard:
         # Create coverage heatmap (simplified)
         lat_bins = np.linspace(-90, 90, 37)
         lon_bins = np.linspace(-180, 180, 73)
-        coverage = np.zeros((len(lat_bins)-1, len(lon_bins)-1))
         
         # Count satellite passes in each bin
-        for sat in self.sim.satellites:
-            hist = self.sim.history[sat.name]
-            for lat, lon in zip(hist['lat'], hist['lon']):
-                lat_idx = np.searchsorted(lat_bins, lat) - 1
-                lon_idx = np.searchsorted(lon_bins, lon) - 1
-                if 0 <= lat_idx < len(lat_bins)-1 and 0 <= lon_idx < len(lon_bins)-1:
-                    coverage[lat_idx, lon_idx] += 1
+        lla = self.lla_f32
+        counts, _, _ = np.histogram2d(lla[..., 0].ravel(), lla[..., 1].ravel(),
+                                      bins=[lat_bins, lon_bins])
+        coverage = counts.astype(np.float32)
         
-        # Normalize
-        coverage = coverage / coverage.max() * 100
+        # Normalize in place (an empty map stays at zero)
+        peak = coverage.max()
+        if peak:
+            coverage *= 100.0 / peak
         
         im = ax.imshow(coverage, extent=[-180, 180, -90, 90], origin='lower',
                       cmap='viridis', alpha=0.8, aspect='auto')
@@ -679,21 +973,23 @@ def run_demo():
     
     # Create a mixed constellation demo (LEO like Starlink/OneWeb)
     altitude = 550000
-    a = R_EARTH + altitude
-    inc = np.radians(53.0)
-    
-    sats = []
-    colors = ['#00d4ff', '#ff6b35', '#00ff9f']
-    
-    for plane in range(3):
-        raan = np.radians(plane * 40)
-        for sat_num in range(6):
-            nu = np.radians(sat_num * 60)
-            sats.append(Satellite(
-                name=f"Sat-{plane}-{sat_num}",
-                a=a, e=0.0, i=inc, raan=raan, arg_p=0.0, nu=nu,
-                color=colors[plane]
-            ))
+    colors = np.array(['#00d4ff', '#ff6b35', '#00ff9f'])
+    
+    # 3 planes x 6 slots, flattened plane-major
+    plane, slot = np.meshgrid(np.arange(3), np.arange(6), indexing='ij')
+    plane, slot = plane.ravel(), slot.ravel()
+    n_sats = plane.size
+    
+    sats = ConstellationArray(
+        name=np.array([f"Sat-{p}-{s}" for p, s in zip(plane, slot)]),
+        a=np.full(n_sats, R_EARTH + altitude),
+        e=np.zeros(n_sats),
+        i=np.full(n_sats, np.radians(53.0)),
+        raan=np.radians(plane * 40.0),
+        arg_p=np.zeros(n_sats),
+        nu=np.radians(slot * 60.0),
+        color=colors[plane],
+    )
     
     print(f"Simulating {len(sats)} satellites...")
     sim = ConstellationSimulator(sats)
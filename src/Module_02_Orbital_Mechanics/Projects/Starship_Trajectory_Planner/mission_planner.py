@@ -6,6 +6,7 @@ A comprehensive educational tool for understanding Earth-to-Mars missions.
 Covers all mission phases with detailed explanations and real physics.
 """
 
+import math
 import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.patches import FancyBboxPatch, Circle, Wedge, Rectangle, FancyArrowPatch
@@ -13,9 +14,21 @@ from matplotlib.path import Path
 from matplotlib.widgets import Button
 from matplotlib.collections import LineCollection
 import matplotlib.animation as animation
-from dataclasses import dataclass
+from scipy.integrate import solve_ivp
+from dataclasses import dataclass, field
 from typing import Dict, List, Tuple
 
+try:
+    from numba import njit, prange
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional; the kernels then run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda fn: fn
+    prange = range
+    HAVE_NUMBA = False
+
 # =============================================================================
 # PHYSICAL CONSTANTS
 # =============================================================================
@@ -40,6 +53,24 @@ T_MARS = 686.98 * 24 * 3600      # Mars orbital period (s)
 W_EARTH = 2 * np.pi / T_EARTH    # Earth angular velocity
 W_MARS = 2 * np.pi / T_MARS      # Mars angular velocity
 
+KEPLER_TABLE_SIZE = 4096         # E(M) samples over the transfer half-orbit
+
+LAMBERT_TOL = 1e-10              # Householder step tolerance (Izzo's x)
+LAMBERT_MAX_ITER = 35
+
+# Porkchop ephemeris: circular, coplanar orbits with Mars leading Earth by
+# this angle on day 0, which puts the launch window inside the plotted grid
+MARS_PHASE_0 = math.radians(115)
+MIN_TRANSIT_DAYS = 120
+
+# Longer trajectories are strided down to about this many animation frames
+MAX_ANIM_FRAMES = 300
+TRAIL_FRAMES = 80                # Overview ship trail length (animation frames)
+
+# compute_trajectory's keys, in order; also the simulator's packed column order
+TRAJ_KEYS = ('time', 'days', 'earth_x', 'earth_y', 'mars_x', 'mars_y',
+             'ship_x', 'ship_y', 'ship_v', 'ship_r')
+
 # =============================================================================
 # MISSION DATABASE
 # =============================================================================
@@ -65,157 +96,503 @@ MARS_MISSIONS = {
 # PHYSICS CALCULATIONS
 # =============================================================================
 
-@dataclass
+@dataclass(frozen=True)
 class HohmannTransfer:
-    """Hohmann transfer orbit between two circular orbits."""
+    """Hohmann transfer orbit between two circular orbits.
+    
+    The derived quantities are computed once in __post_init__ and stored as
+    plain attributes, so call sites can read them freely. The instance is
+    frozen so they can never fall out of step with r1, r2 and mu; they are
+    left out of repr and eq, which compare the inputs only.
+    """
     r1: float  # Inner orbit radius
     r2: float  # Outer orbit radius
     mu: float  # Central body gravitational parameter
     
-    @property
-    def semi_major_axis(self) -> float:
-        return (self.r1 + self.r2) / 2
+    semi_major_axis: float = field(init=False, repr=False, compare=False)
+    eccentricity: float = field(init=False, repr=False, compare=False)
+    mean_motion: float = field(init=False, repr=False, compare=False)
+    transfer_time: float = field(init=False, repr=False, compare=False)
+    delta_v_departure: float = field(init=False, repr=False, compare=False)
+    delta_v_arrival: float = field(init=False, repr=False, compare=False)
+    total_delta_v: float = field(init=False, repr=False, compare=False)
+    phase_angle: float = field(init=False, repr=False, compare=False)
     
-    @property
-    def eccentricity(self) -> float:
-        return (self.r2 - self.r1) / (self.r2 + self.r1)
+    # Kepler lookup table: mean anomaly -> eccentric anomaly over [0, pi]
+    _M_table: np.ndarray = field(init=False, repr=False, compare=False)
+    _E_table: np.ndarray = field(init=False, repr=False, compare=False)
     
-    @property
-    def transfer_time(self) -> float:
-        return np.pi * np.sqrt(self.semi_major_axis**3 / self.mu)
-    
-    @property
-    def delta_v_departure(self) -> float:
-        v_circular = np.sqrt(self.mu / self.r1)
-        v_transfer = np.sqrt(self.mu * (2/self.r1 - 1/self.semi_major_axis))
-        return abs(v_transfer - v_circular)
-    
-    @property
-    def delta_v_arrival(self) -> float:
-        v_circular = np.sqrt(self.mu / self.r2)
-        v_transfer = np.sqrt(self.mu * (2/self.r2 - 1/self.semi_major_axis))
-        return abs(v_circular - v_transfer)
-    
-    @property
-    def total_delta_v(self) -> float:
-        return self.delta_v_departure + self.delta_v_arrival
-    
-    @property
-    def phase_angle(self) -> float:
-        return np.pi - W_MARS * self.transfer_time
-
-
-def compute_trajectory(transfer: HohmannTransfer, n_points: int = 400) -> Dict:
-    """Compute transfer trajectory positions and velocities."""
-    t_total = transfer.transfer_time
-    t = np.linspace(0, t_total, n_points)
+    def __post_init__(self):
+        r1, r2, mu = self.r1, self.r2, self.mu
+        r_sum = r1 + r2
+        inv_a = 2 / r_sum
+        e = (r2 - r1) / r_sum
+        n = math.sqrt(mu * inv_a**3)
+        transfer_time = math.pi / n
+        
+        # Circular and transfer-orbit speeds at each end (vis-viva)
+        v1c = math.sqrt(mu / r1)
+        v2c = math.sqrt(mu / r2)
+        v1t = math.sqrt(mu * (2/r1 - inv_a))
+        v2t = math.sqrt(mu * (2/r2 - inv_a))
+        dv_dep = abs(v1t - v1c)
+        dv_arr = abs(v2c - v2t)
+        
+        # Tabulate M(E) in closed form; inverting it by interpolation needs
+        # no iteration (M is monotonic in E for e < 1)
+        E_table = np.linspace(0, math.pi, KEPLER_TABLE_SIZE)
+        
+        derived = {
+            'semi_major_axis': r_sum / 2,
+            'eccentricity': e,
+            'mean_motion': n,
+            'transfer_time': transfer_time,
+            'delta_v_departure': dv_dep,
+            'delta_v_arrival': dv_arr,
+            'total_delta_v': dv_dep + dv_arr,
+            'phase_angle': math.pi - W_MARS * transfer_time,
+            '_M_table': E_table - e * np.sin(E_table),
+            '_E_table': E_table,
+        }
+        for name, value in derived.items():
+            object.__setattr__(self, name, value)
+
+
+@njit('UniTuple(f8[::1], 8)(f8[::1], f8[::1], f8, f8, f8, f8)', cache=True,
+      fastmath=True, parallel=True, nogil=True)
+def _trajectory_core(t, E, a, e, phase, mu):
+    """Earth, Mars and ship positions (AU), ship speed (km/s) and radius (AU) at t.
     
+    E is the ship's eccentric anomaly at each t.
+    """
     # Earth orbit
     theta_earth = W_EARTH * t
     earth_x = np.cos(theta_earth)
     earth_y = np.sin(theta_earth)
     
     # Mars orbit (starts at phase angle)
-    phase = transfer.phase_angle
     theta_mars = phase + W_MARS * t
     mars_x = 1.524 * np.cos(theta_mars)
     mars_y = 1.524 * np.sin(theta_mars)
     
-    # Spacecraft on transfer ellipse
-    a = transfer.semi_major_axis
-    e = transfer.eccentricity
-    n = np.sqrt(transfer.mu / a**3)
-    
-    ship_x, ship_y, ship_v, ship_r = [], [], [], []
+    # Spacecraft on transfer ellipse: position straight from E
+    # (r cos nu = a(cos E - e), r sin nu = b sin E), so nu is never needed
+    cos_E = np.cos(E)
+    r = a * (1 - e * cos_E)
+    a_au = a / AU
+    ship_x = (cos_E - e) * a_au
+    ship_y = np.sin(E) * (a_au * math.sqrt(1 - e**2))
+    ship_v = np.sqrt(mu * (2/r - 1/a)) * 1e-3
+    ship_r = r / AU
+    return earth_x, earth_y, mars_x, mars_y, ship_x, ship_y, ship_v, ship_r
+
+
+def compute_trajectory(transfer: HohmannTransfer, n_points: int = 400,
+                       dtype=np.float64) -> Dict:
+    """
+    Compute transfer trajectory positions and velocities.
     
-    for ti in t:
-        M = n * ti
-        E = M
-        for _ in range(15):
-            E = M + e * np.sin(E)
-        
-        nu = 2 * np.arctan2(np.sqrt(1+e)*np.sin(E/2), np.sqrt(1-e)*np.cos(E/2))
-        r = a * (1 - e**2) / (1 + e * np.cos(nu))
-        
-        ship_x.append(r * np.cos(nu) / AU)
-        ship_y.append(r * np.sin(nu) / AU)
-        ship_r.append(r / AU)
-        ship_v.append(np.sqrt(transfer.mu * (2/r - 1/a)) / 1000)
-    
-    return {
-        'time': t, 'days': t / 86400,
-        'earth_x': earth_x, 'earth_y': earth_y,
-        'mars_x': mars_x, 'mars_y': mars_y,
-        'ship_x': np.array(ship_x), 'ship_y': np.array(ship_y),
-        'ship_v': np.array(ship_v), 'ship_r': np.array(ship_r)
-    }
-
-
-def simulate_edl(v0: float = 5500, angle: float = -12, mass: float = 1000,
-                 cd: float = 1.5, area: float = 15) -> Dict:
-    """Simulate Mars Entry, Descent, and Landing."""
-    h, v, gamma = MARS_ATMO_HEIGHT, v0, np.radians(angle)
+    The eccentric anomaly is interpolated from the transfer's Kepler table
+    (error ~1e-8 rad) rather than solved per sample. The math runs in
+    float64; dtype only sets the precision of the returned arrays (float32
+    is ample for arrays that are only plotted).
+    """
+    t = np.linspace(0, transfer.transfer_time, n_points)
+    E = np.interp(transfer.mean_motion * t, transfer._M_table, transfer._E_table)
+    cols = _trajectory_core(t, E, transfer.semi_major_axis, transfer.eccentricity,
+                            transfer.phase_angle, transfer.mu)
+    return {k: v.astype(dtype, copy=False)
+            for k, v in zip(TRAJ_KEYS, (t, t / 86400, *cols))}
+
+
+# Explicit double-precision signature: compiled eagerly (and cached on disk)
+# at import instead of on the first simulate_edl call. Like the other array
+# kernels it releases the GIL, so callers may overlap it with other threads
+@njit('UniTuple(f8[::1], 7)(f8, f8, f8, f8, f8)', cache=True, fastmath=True, nogil=True)
+def _edl_core(v0, angle, mass, cd, area):
+    """Euler-integrate the entry and return the samples logged every 0.3 s."""
+    h, v, gamma = MARS_ATMO_HEIGHT, v0, math.radians(angle)
     dt = 0.1
+    drag_coeff = cd * area / mass  # loop-invariant part of the drag term
+    n_max = int(500 / dt) + 2
     
-    data = {'time': [0], 'alt': [h/1000], 'vel': [v], 'g_load': [0], 
-            'heat': [0], 'mach': [0], 'dyn_press': [0]}
-    t = 0
+    time = np.zeros(n_max)
+    alt = np.zeros(n_max)
+    vel = np.zeros(n_max)
+    g_load = np.zeros(n_max)
+    heat_flux = np.zeros(n_max)
+    mach_no = np.zeros(n_max)
+    dyn_press = np.zeros(n_max)
+    alt[0] = h / 1000
+    vel[0] = v
+    k = 1
+    t = 0.0
+    t_log = 0.3  # next logging threshold, kept as a running scalar
     
     while h > 0 and v > 50 and t < 500:
-        rho = MARS_RHO_0 * np.exp(-h / MARS_SCALE_HEIGHT)
+        rho = MARS_RHO_0 * math.exp(-h / MARS_SCALE_HEIGHT)
         g = MU_MARS / (R_MARS + h)**2
         q = 0.5 * rho * v**2
-        drag = q * cd * area / mass
+        drag = q * drag_coeff
         
         # Heat flux (Sutton-Graves)
-        heat = 1.83e-4 * np.sqrt(rho) * v**3 / 1e6
+        heat = 1.83e-4 * math.sqrt(rho) * v**3 / 1e6
         
         # Mars speed of sound ~240 m/s
         mach = v / 240
         
-        dv = -drag - g * np.sin(gamma)
-        dgamma = (v/(R_MARS+h) - g/v) * np.cos(gamma)
-        dh = v * np.sin(gamma)
+        sin_g, cos_g = math.sin(gamma), math.cos(gamma)
+        dv = -drag - g * sin_g
+        dgamma = (v/(R_MARS+h) - g/v) * cos_g
+        dh = v * sin_g
         
         h += dh * dt
         v += dv * dt
         gamma += dgamma * dt
         t += dt
         
-        if t > data['time'][-1] + 0.3:
-            data['time'].append(t)
-            data['alt'].append(max(0, h/1000))
-            data['vel'].append(v)
-            data['g_load'].append(abs(dv) / 9.81)
-            data['heat'].append(heat)
-            data['mach'].append(mach)
-            data['dyn_press'].append(q / 1000)  # kPa
+        if t > t_log:
+            time[k] = t
+            alt[k] = max(0.0, h/1000)
+            vel[k] = v
+            g_load[k] = abs(dv) / 9.81
+            heat_flux[k] = heat
+            mach_no[k] = mach
+            dyn_press[k] = q / 1000  # kPa
+            t_log = t + 0.3
+            k += 1
     
-    return {k: np.array(v) for k, v in data.items()}
+    return (time[:k], alt[:k], vel[:k], g_load[:k],
+            heat_flux[:k], mach_no[:k], dyn_press[:k])
 
 
-def compute_porkchop() -> Dict:
-    """Compute porkchop plot data."""
-    launch = np.linspace(0, 400, 50)
-    arrival = np.linspace(180, 550, 50)
-    X, Y = np.meshgrid(launch, arrival)
-    Z = np.full_like(X, np.nan)
+def _edl_rhs(t, y, drag_coeff):
+    """Entry equations of motion: d/dt of (h, v, gamma)."""
+    h, v, gamma = y
+    rho = MARS_RHO_0 * math.exp(-h / MARS_SCALE_HEIGHT)
+    g = MU_MARS / (R_MARS + h)**2
+    sin_g = math.sin(gamma)
+    return (v * sin_g,
+            -0.5 * rho * v * v * drag_coeff - g * sin_g,
+            (v/(R_MARS+h) - g/v) * math.cos(gamma))
+
+
+def _edl_ground(t, y, drag_coeff):
+    return y[0]
+
+
+def _edl_slow(t, y, drag_coeff):
+    return y[1] - 50
+
+
+# Both events end the entry, matching the Euler loop's stopping conditions
+_edl_ground.terminal = _edl_slow.terminal = True
+_edl_ground.direction = _edl_slow.direction = -1
+
+
+def _edl_adaptive(v0, angle, mass, cd, area, rtol):
+    """Integrate the entry with LSODA and sample it every 0.3 s."""
+    drag_coeff = cd * area / mass
+    sol = solve_ivp(_edl_rhs, (0, 500), [MARS_ATMO_HEIGHT, v0, math.radians(angle)],
+                    method='LSODA', events=(_edl_ground, _edl_slow), rtol=rtol,
+                    atol=(1e-3, 1e-4, 1e-9), dense_output=True, args=(drag_coeff,))
+    
+    time = np.arange(0, sol.t[-1], 0.3)
+    h, v, gamma = sol.sol(time)
+    rho = MARS_RHO_0 * np.exp(-h / MARS_SCALE_HEIGHT)
+    g = MU_MARS / (R_MARS + h)**2
+    q = 0.5 * rho * v**2
+    dv = -q * drag_coeff - g * np.sin(gamma)
+    return (time, np.maximum(h, 0) / 1000, v, np.abs(dv) / 9.81,
+            1.83e-4 * np.sqrt(rho) * v**3 / 1e6, v / 240, q / 1000)
+
+
+def simulate_edl(v0: float = 5500, angle: float = -12, mass: float = 1000,
+                 cd: float = 1.5, area: float = 15, method: str = 'euler',
+                 rtol: float = 1e-6, dtype=np.float64) -> Dict:
+    """
+    Simulate Mars Entry, Descent, and Landing, sampled every 0.3 s.
+    
+    method='euler' takes fixed 0.1 s steps. method='lsoda' lets SciPy's LSODA
+    size the steps to rtol and stops on the ground/slow-down events, so the
+    long smooth stretches of the descent cost only a few steps. Integration
+    is always float64; dtype sets the precision of the returned samples.
+    """
+    if method not in ('euler', 'lsoda'):
+        raise ValueError(f"Unknown integration method: {method!r}")
+    
+    keys = ('time', 'alt', 'vel', 'g_load', 'heat', 'mach', 'dyn_press')
+    args = (float(v0), float(angle), float(mass), float(cd), float(area))
+    if method == 'lsoda':
+        samples = _edl_adaptive(*args, rtol)
+    else:
+        samples = _edl_core(*args)
+    return {k: v.astype(dtype, copy=False) for k, v in zip(keys, samples)}
+
+
+@njit(cache=True)
+def _hyp2f1b(x):
+    """Hypergeometric 2F1(3, 1, 5/2, x) used by Izzo's Battin-series branch."""
+    if x >= 1.0:
+        return math.inf
+    res, term, k = 1.0, 1.0, 0
+    while True:
+        term = term * (3 + k) * (1 + k) / (2.5 + k) * x / (k + 1)
+        res_old = res
+        res += term
+        if res == res_old:
+            return res
+        k += 1
+
+
+@njit(cache=True)
+def _izzo_tof(x, y, lam):
+    """Non-dimensional time of flight for Izzo's x (single revolution)."""
+    if math.sqrt(0.6) < x < math.sqrt(1.4):
+        # Near-parabolic: Battin's series avoids the cancellation below
+        eta = y - lam * x
+        q = 4 / 3 * _hyp2f1b((1 - lam - x * eta) * 0.5)
+        return (eta**3 * q + 4 * lam * eta) * 0.5
+    umx2 = 1 - x * x
+    if x < 1:
+        psi = math.acos(x * y + lam * umx2)
+    else:
+        psi = math.asinh((y - x * lam) * math.sqrt(-umx2))
+    return (psi / math.sqrt(abs(umx2)) - x + lam * y) / umx2
+
+
+@njit(cache=True)
+def _izzo_x(T, lam):
+    """Solve T(x) = T for Izzo's x by Householder iteration; NaN on failure."""
+    # Initial guess (Izzo 2015, eq. 30)
+    T_0 = math.acos(lam) + lam * math.sqrt(1 - lam * lam)
+    T_1 = 2 * (1 - lam**3) / 3
+    if T >= T_0:
+        x = (T_0 / T) ** (2 / 3) - 1
+    elif T < T_1:
+        x = 2.5 * T_1 / T * (T_1 - T) / (1 - lam**5) + 1
+    else:
+        x = (T_0 / T) ** (math.log(T_1 / T_0) / math.log(2)) - 1
+    
+    l2, l3 = lam * lam, lam**3
+    for _ in range(LAMBERT_MAX_ITER):
+        y = math.sqrt(1 - l2 * (1 - x * x))
+        umx2 = 1 - x * x
+        tof = _izzo_tof(x, y, lam)
+        f = tof - T
+        d1 = (3 * tof * x - 2 + 2 * l3 * x / y) / umx2
+        d2 = (3 * tof + 5 * x * d1 + 2 * (1 - l2) * l3 / y**3) / umx2
+        d3 = (7 * x * d2 + 8 * d1 - 6 * (1 - l2) * l2 * l3 * x / y**5) / umx2
+        step = f * (d1 * d1 - f * d2 / 2) / (d1 * (d1 * d1 - f * d2) + d3 * f * f / 6)
+        x -= step
+        if abs(step) < LAMBERT_TOL:
+            return x
+    return math.nan
+
+
+@njit(cache=True)
+def _lambert_izzo(mu, r1, r2, tof, v1, v2):
+    """Prograde, zero-revolution Lambert solve (Izzo 2015) into v1 and v2."""
+    r1_norm = math.sqrt(r1[0]**2 + r1[1]**2 + r1[2]**2)
+    r2_norm = math.sqrt(r2[0]**2 + r2[1]**2 + r2[2]**2)
+    c_norm = math.sqrt((r2[0] - r1[0])**2 + (r2[1] - r1[1])**2 + (r2[2] - r1[2])**2)
+    r_sum = r1_norm + r2_norm
+    s = (r_sum + c_norm) * 0.5
+    
+    # Orbit normal; a straight 180 deg transfer is taken in the ecliptic
+    hx = r1[1] * r2[2] - r1[2] * r2[1]
+    hy = r1[2] * r2[0] - r1[0] * r2[2]
+    hz = r1[0] * r2[1] - r1[1] * r2[0]
+    h_norm = math.sqrt(hx * hx + hy * hy + hz * hz)
+    if h_norm == 0:
+        hx, hy, hz = 0.0, 0.0, 1.0
+    else:
+        hx, hy, hz = hx / h_norm, hy / h_norm, hz / h_norm
+    
+    lam = math.sqrt(1 - min(1.0, c_norm / s))
+    sense = 1.0
+    if hz < 0:
+        # Transfer angle > 180 deg: flip so the tangential direction is prograde
+        lam, sense = -lam, -1.0
+    
+    x = _izzo_x(math.sqrt(2 * mu / s**3) * tof, lam)
+    y = math.sqrt(1 - lam * lam * (1 - x * x))
+    
+    gamma = math.sqrt(mu * s / 2)
+    rho = (r1_norm - r2_norm) / c_norm
+    sigma = math.sqrt(1 - rho * rho)
+    vr1 = gamma * ((lam * y - x) - rho * (lam * y + x)) / r1_norm
+    vr2 = -gamma * ((lam * y - x) + rho * (lam * y + x)) / r2_norm
+    vt = gamma * sigma * (y + lam * x)
+    vt1, vt2 = sense * vt / r1_norm, sense * vt / r2_norm
+    
+    for r, r_norm, vr, vt_k, v in ((r1, r1_norm, vr1, vt1, v1), (r2, r2_norm, vr2, vt2, v2)):
+        ix, iy, iz = r[0] / r_norm, r[1] / r_norm, r[2] / r_norm
+        # Tangential unit vector h x i_r
+        v[0] = vr * ix + vt_k * (hy * iz - hz * iy)
+        v[1] = vr * iy + vt_k * (hz * ix - hx * iz)
+        v[2] = vr * iz + vt_k * (hx * iy - hy * ix)
+
+
+@njit('UniTuple(f8[:, ::1], 2)(f8[::1], f8[::1])', cache=True, parallel=True, nogil=True)
+def _porkchop_core(launch: np.ndarray, arrival: np.ndarray):
+    """Z and C3 over the [arrival, launch] day grid; NaN below MIN_TRANSIT_DAYS."""
+    n_arr, n_launch = arrival.shape[0], launch.shape[0]
+    Z = np.empty((n_arr, n_launch))
+    C3 = np.empty((n_arr, n_launch))
+    v_e, v_m = R_EARTH_ORBIT * W_EARTH, R_MARS_ORBIT * W_MARS
     
-    for i, arr in enumerate(arrival):
-        for j, lnch in enumerate(launch):
-            dt = (arr - lnch) * 86400
-            if dt < 120 * 86400:
+    for i in prange(n_arr):
+        # Per-row work buffers; Mars' state depends only on the arrival day
+        r1, r2 = np.zeros(3), np.zeros(3)
+        v1, v2 = np.empty(3), np.empty(3)
+        t2 = arrival[i] * 86400
+        cm, sm = math.cos(MARS_PHASE_0 + W_MARS * t2), math.sin(MARS_PHASE_0 + W_MARS * t2)
+        r2[0], r2[1] = R_MARS_ORBIT * cm, R_MARS_ORBIT * sm
+        
+        for j in range(n_launch):
+            t1 = launch[j] * 86400
+            if t2 - t1 < MIN_TRANSIT_DAYS * 86400:
+                Z[i, j] = C3[i, j] = math.nan
                 continue
+            ce, se = math.cos(W_EARTH * t1), math.sin(W_EARTH * t1)
+            r1[0], r1[1] = R_EARTH_ORBIT * ce, R_EARTH_ORBIT * se
+            _lambert_izzo(MU_SUN, r1, r2, t2 - t1, v1, v2)
             
-            # Simplified Lambert approximation
-            t_hohmann = np.pi * np.sqrt(((R_EARTH_ORBIT + R_MARS_ORBIT)/2)**3 / MU_SUN)
-            ratio = dt / t_hohmann
-            
-            base = 5.6
-            penalty = 1200 * (np.log(max(ratio, 0.4))**2)
-            Z[i, j] = base + penalty / 1000
+            # Hyperbolic excess speeds against the circular planet velocities
+            v_inf_dep = math.sqrt((v1[0] + v_e * se)**2 + (v1[1] - v_e * ce)**2
+                                  + v1[2]**2) / 1000
+            v_inf_arr = math.sqrt((v2[0] + v_m * sm)**2 + (v2[1] - v_m * cm)**2
+                                  + v2[2]**2) / 1000
+            Z[i, j] = v_inf_dep + v_inf_arr
+            C3[i, j] = v_inf_dep * v_inf_dep
+    return Z, C3
+
+
+def _izzo_x_grid(T, lam):
+    """Array form of _izzo_x: every cell iterates in lockstep until converged."""
+    T_0 = np.arccos(lam) + lam * np.sqrt(1 - lam * lam)
+    T_1 = 2 * (1 - lam**3) / 3
+    x = np.where(T >= T_0, (T_0 / T) ** (2 / 3) - 1,
+                 np.where(T < T_1, 2.5 * T_1 / T * (T_1 - T) / (1 - lam**5) + 1,
+                          (T_0 / T) ** (np.log(T_1 / T_0) / np.log(2)) - 1))
+
+    l2, l3 = lam * lam, lam**3
+    active = np.ones(x.shape, dtype=bool)
+    for _ in range(LAMBERT_MAX_ITER):
+        xa, la, l2a, l3a = x[active], lam[active], l2[active], l3[active]
+        umx2 = 1 - xa * xa
+        y = np.sqrt(1 - l2a * umx2)
+
+        # Time of flight: Battin's series near x = 1, Lagrange's form elsewhere
+        tof = np.empty_like(xa)
+        battin = (math.sqrt(0.6) < xa) & (xa < math.sqrt(1.4))
+        xb, yb, lb = xa[battin], y[battin], la[battin]
+        eta = yb - lb * xb
+        q = 4 / 3 * _hyp2f1b_grid((1 - lb - xb * eta) * 0.5)
+        tof[battin] = (eta**3 * q + 4 * lb * eta) * 0.5
+
+        lag = ~battin
+        xg, yg, lg, ug = xa[lag], y[lag], la[lag], umx2[lag]
+        ell = xg < 1
+        psi = np.empty_like(xg)
+        psi[ell] = np.arccos(xg[ell] * yg[ell] + lg[ell] * ug[ell])
+        psi[~ell] = np.arcsinh((yg[~ell] - xg[~ell] * lg[~ell]) * np.sqrt(-ug[~ell]))
+        tof[lag] = (psi / np.sqrt(np.abs(ug)) - xg + lg * yg) / ug
+
+        f = tof - T[active]
+        d1 = (3 * tof * xa - 2 + 2 * l3a * xa / y) / umx2
+        d2 = (3 * tof + 5 * xa * d1 + 2 * (1 - l2a) * l3a / y**3) / umx2
+        d3 = (7 * xa * d2 + 8 * d1 - 6 * (1 - l2a) * l2a * l3a * xa / y**5) / umx2
+        step = f * (d1 * d1 - f * d2 / 2) / (d1 * (d1 * d1 - f * d2) + d3 * f * f / 6)
+        x[active] = xa - step
+
+        active[active] = ~(np.abs(step) < LAMBERT_TOL)
+        if not active.any():
+            break
+    x[active] = np.nan
+    return x
+
+
+def _hyp2f1b_grid(x):
+    """Array form of _hyp2f1b, summing the series until no element changes."""
+    out = np.full(x.shape, math.inf)
+    conv = x < 1.0
+    x = x[conv]
+    res, term, k = np.ones_like(x), np.ones_like(x), 0
+    while True:
+        term = term * (3 + k) * (1 + k) / (2.5 + k) * x / (k + 1)
+        res_old = res
+        res = res + term
+        if np.all(res == res_old):
+            out[conv] = res
+            return out
+        k += 1
+
+
+def _porkchop_grid(launch: np.ndarray, arrival: np.ndarray):
+    """NumPy-only _porkchop_core: one Lambert solve over the whole grid at once."""
+    t1 = launch * 86400
+    t2 = arrival[:, None] * 86400
+    tof = t2 - t1
+    valid = tof >= MIN_TRANSIT_DAYS * 86400
+    i_arr, i_launch = np.nonzero(valid)
+
+    # Planet states on circular, coplanar orbits, one row per valid cell
+    th_e = W_EARTH * t1[i_launch]
+    th_m = MARS_PHASE_0 + W_MARS * t2[i_arr, 0]
+    ce, se = np.cos(th_e), np.sin(th_e)
+    cm, sm = np.cos(th_m), np.sin(th_m)
+    r1_norm, r2_norm = R_EARTH_ORBIT, R_MARS_ORBIT
+    c_norm = np.hypot(r2_norm * cm - r1_norm * ce, r2_norm * sm - r1_norm * se)
+    s = (r1_norm + r2_norm + c_norm) * 0.5
+
+    # In-plane transfers: the orbit normal is +z, or -z beyond 180 deg
+    sense = np.where(ce * sm - se * cm < 0, -1.0, 1.0)
+    lam = sense * np.sqrt(1 - np.minimum(1.0, c_norm / s))
+    x = _izzo_x_grid(np.sqrt(2 * MU_SUN / s**3) * tof[valid], lam)
+    y = np.sqrt(1 - lam * lam * (1 - x * x))
+
+    gamma = np.sqrt(MU_SUN * s / 2)
+    rho = (r1_norm - r2_norm) / c_norm
+    sigma = np.sqrt(1 - rho * rho)
+    vr1 = gamma * ((lam * y - x) - rho * (lam * y + x)) / r1_norm
+    vr2 = -gamma * ((lam * y - x) + rho * (lam * y + x)) / r2_norm
+    vt = sense * gamma * sigma * (y + lam * x)
+    vt1, vt2 = vt / r1_norm, vt / r2_norm
+
+    # Radial/tangential components against the circular planet velocities;
+    # the tangential unit vector (h x i_r) is sense * (-sin, cos)
+    v_e, v_m = R_EARTH_ORBIT * W_EARTH, R_MARS_ORBIT * W_MARS
+    v_inf_dep = np.hypot(vr1, sense * vt1 - v_e) / 1000
+    v_inf_arr = np.hypot(vr2, sense * vt2 - v_m) / 1000
+
+    Z = np.full(tof.shape, np.nan)
+    C3 = np.full(tof.shape, np.nan)
+    Z[valid] = v_inf_dep + v_inf_arr
+    C3[valid] = v_inf_dep * v_inf_dep
+    return Z, C3
+
+
+if not HAVE_NUMBA:
+    # Without the JIT, the per-cell loop above runs in the interpreter; the
+    # array form solves every cell of the grid in one set of NumPy passes
+    _porkchop_core = _porkchop_grid
+
+
+def compute_porkchop(dtype=np.float64) -> Dict:
+    """Compute porkchop plot data from Lambert solutions over the date grid.
     
-    return {'X': X, 'Y': Y, 'Z': Z, 'launch': launch, 'arrival': arrival}
+    Z is the total hyperbolic excess speed (departure + arrival, km/s); C3 is
+    the departure energy (km^2/s^2). Both are indexed [arrival, launch], so
+    they contour directly against the 1-D launch and arrival day axes. The
+    solves run in float64; dtype sets the precision of Z and C3.
+    """
+    launch = np.linspace(0, 400, 50)
+    arrival = np.linspace(180, 550, 50)
+    Z, C3 = _porkchop_core(launch, arrival)
+    return {'Z': Z.astype(dtype, copy=False), 'C3': C3.astype(dtype, copy=False),
+            'launch': launch, 'arrival': arrival}
 
 
 # =============================================================================
@@ -259,7 +636,11 @@ class MarsMissionSimulator:
         self.view = 0
         self.views = ['OVERVIEW', 'TRANSIT', 'EDL', 'MISSIONS', 'WINDOWS']
         self.anim = None
-        self.transit_anim = None
+        
+        # Every view is drawn once into persistent axes that are then only
+        # hidden/shown: view index -> (axes, (update, frames, interval) or None)
+        self._axes_by_view = {}
+        self._anim_spec = None
         
         print("=" * 50)
         print("  MARS MISSION SIMULATOR")
@@ -269,9 +650,14 @@ class MarsMissionSimulator:
         
         # Pre-compute
         self.transfer = HohmannTransfer(R_EARTH_ORBIT, R_MARS_ORBIT, MU_SUN)
-        self.traj = compute_trajectory(self.transfer)
-        self.edl = simulate_edl()
-        self.porkchop = compute_porkchop()
+        # These arrays are only plotted, so single precision is plenty
+        traj = compute_trajectory(self.transfer, dtype=np.float32)
+        # Packed (sample, TRAJ_KEYS column) block, so each animation frame
+        # reads one contiguous row; self.traj keeps named column views
+        self._traj_rows = np.stack([traj[k] for k in TRAJ_KEYS], axis=1)
+        self.traj = {k: self._traj_rows[:, j] for j, k in enumerate(TRAJ_KEYS)}
+        self.edl = simulate_edl(dtype=np.float32)
+        self.porkchop = compute_porkchop(dtype=np.float32)
         
         print("Ready!\n")
         
@@ -279,7 +665,8 @@ class MarsMissionSimulator:
         self.fig = plt.figure(figsize=(17, 10))
         self.fig.patch.set_facecolor('#04040a')
         self._setup_nav()
-        self._draw()
+        self._build_views()
+        self._show(self.view)
     
     def _setup_nav(self):
         """Setup navigation."""
@@ -299,28 +686,44 @@ class MarsMissionSimulator:
     
     def _switch(self, idx):
         """Switch view."""
+        # The animation is dropped rather than paused: a paused blitting
+        # animation restarts itself after a canvas resize
         if self.anim:
             self.anim.event_source.stop()
             self.anim = None
-        if self.transit_anim:
-            self.transit_anim.event_source.stop()
-            self.transit_anim = None
         
-        self.view = idx
-        self._clear()
-        self._draw()
+        for ax in self._axes_by_view[self.view][0]:
+            ax.set_visible(False)
+        self._show(idx)
         self.fig.canvas.draw_idle()
     
-    def _clear(self):
-        """Clear axes."""
-        for ax in self.fig.axes[:]:
-            if ax not in self.btn_axes:
-                ax.remove()
+    def _build_views(self):
+        """Draw every view once into its own set of hidden axes."""
+        draws = [self._draw_overview, self._draw_transit, self._draw_edl,
+                 self._draw_missions, self._draw_windows]
+        for idx, draw in enumerate(draws):
+            existing_axes = set(self.fig.axes)
+            self._anim_spec = None
+            draw()
+            new_axes = [ax for ax in self.fig.axes if ax not in existing_axes]
+            for ax in new_axes:
+                ax.set_visible(False)
+            self._axes_by_view[idx] = (new_axes, self._anim_spec)
+    
+    def _show(self, idx):
+        """Reveal a pre-built view and start its animation, if it has one."""
+        self.view = idx
+        axes, anim_spec = self._axes_by_view[idx]
+        for ax in axes:
+            ax.set_visible(True)
+        if anim_spec is not None:
+            update, frames, interval = anim_spec
+            self.anim = animation.FuncAnimation(self.fig, update, frames=frames,
+                                                interval=interval, blit=True, repeat=True)
     
-    def _draw(self):
-        """Draw current view."""
-        [self._draw_overview, self._draw_transit, self._draw_edl,
-         self._draw_missions, self._draw_windows][self.view]()
+    def _frame_step(self):
+        """Trajectory samples per animation frame (keeps about MAX_ANIM_FRAMES)."""
+        return max(1, len(self.traj['time']) // MAX_ANIM_FRAMES)
     
     # =========================================================================
     # VIEW 1: OVERVIEW (Animated orbital transfer)
@@ -343,7 +746,7 @@ class MarsMissionSimulator:
         # Transfer ellipse
         a = self.transfer.semi_major_axis / AU
         e = self.transfer.eccentricity
-        b = a * np.sqrt(1 - e**2)
+        b = a * math.sqrt(1 - e**2)
         c = a * e
         t_e = np.linspace(0, np.pi, 100)
         ax.plot(a*np.cos(t_e) - c, b*np.sin(t_e), '--', color='#00ffaa', alpha=0.7, lw=2,
@@ -354,34 +757,59 @@ class MarsMissionSimulator:
             ax.add_patch(Circle((0, 0), r, color='#ffdd00', alpha=alpha, zorder=5))
         ax.text(0, -0.2, 'SUN', color='#ffdd00', fontsize=10, ha='center', fontweight='bold')
         
-        # Animated elements
-        self.earth_dot, = ax.plot([], [], 'o', color='#4488ff', ms=16, mec='white', mew=2, zorder=10)
-        self.mars_dot, = ax.plot([], [], 'o', color='#ff6644', ms=14, mec='white', mew=2, zorder=10)
-        self.ship_dot, = ax.plot([], [], '^', color='#00ffff', ms=12, mec='white', mew=1.5, zorder=15)
-        self.ship_trail, = ax.plot([], [], '-', color='#00ffff', alpha=0.7, lw=2.5, zorder=8)
-        
-        self.earth_lbl = ax.text(0, 0, '', color='#4488ff', fontsize=11, ha='center', fontweight='bold')
-        self.mars_lbl = ax.text(0, 0, '', color='#ff6644', fontsize=11, ha='center', fontweight='bold')
+        # Animated elements (kept out of the blitted background)
+        self.earth_dot, = ax.plot([], [], 'o', color='#4488ff', ms=16, mec='white', mew=2, zorder=10,
+                                  animated=True)
+        self.mars_dot, = ax.plot([], [], 'o', color='#ff6644', ms=14, mec='white', mew=2, zorder=10,
+                                 animated=True)
+        self.ship_dot, = ax.plot([], [], '^', color='#00ffff', ms=12, mec='white', mew=1.5, zorder=15,
+                                 animated=True)
+        self.ship_trail, = ax.plot([], [], '-', color='#00ffff', alpha=0.7, lw=2.5, zorder=8,
+                                   animated=True)
+        
+        self.earth_lbl = ax.text(0, 0, '', color='#4488ff', fontsize=11, ha='center', fontweight='bold',
+                                 animated=True)
+        self.mars_lbl = ax.text(0, 0, '', color='#ff6644', fontsize=11, ha='center', fontweight='bold',
+                                animated=True)
         
         ax.set_xlim(-2.1, 2.1)
         ax.set_ylim(-1.0, 2.0)
         ax.legend(loc='lower left', facecolor='#0a0a18', edgecolor='#333366',
                   labelcolor='white', fontsize=10)
         
-        # Status panel
-        self.status = ax.text(0.02, 0.98, '', transform=ax.transAxes, color='#00ff88',
-                              fontsize=12, fontfamily='monospace', va='top',
-                              bbox=dict(boxstyle='round,pad=0.5', facecolor='#0a0a18',
-                                        edgecolor='#00ff88', alpha=0.95))
+        # Status panel: the rounded box is a static copy of the panel with
+        # invisible glyphs, so each frame redraws only the status text itself
+        status_kw = dict(transform=ax.transAxes, fontsize=12, fontfamily='monospace', va='top')
+        self.status_box = ax.text(0.02, 0.98, '', color='none', **status_kw,
+                                  bbox=dict(boxstyle='round,pad=0.5', facecolor='#0a0a18',
+                                            edgecolor='#00ff88', alpha=0.95))
+        self.status = ax.text(0.02, 0.98, '', color='#00ff88', **status_kw, animated=True)
         
         # Info panel
         self._draw_overview_info()
         
-        # Start animation
-        self.anim = animation.FuncAnimation(
-            self.fig, self._update_overview, frames=len(self.traj['time']),
-            interval=30, blit=False, repeat=True
-        )
+        # Per-sample progress and mission phase, looked up by the update
+        n = len(self.traj['time'])
+        self._progress = np.arange(n) / n * 100
+        # Phase label looked up by how many thresholds (5%, 95%) are passed
+        passed = (self._progress >= 5).astype(np.intp) + (self._progress > 95)
+        self._phase = np.array(['DEPARTURE', 'CRUISE', 'ARRIVAL'])[passed]
+        self._total_days = float(self.traj['days'][-1])
+        self.status_box.set_text(self._status_text(0))
+        
+        # The status text only changes with the frame, so render each
+        # frame's text once here rather than formatting it every frame
+        self._anim_step = step = self._frame_step()
+        self._status_texts = [self._status_text(i) for i in range(0, n, step)]
+        
+        # Ship track at frame resolution behind TRAIL_FRAMES NaNs: every frame's
+        # trail is then a fixed-length window, the NaN head drawing nothing
+        pad = np.full(TRAIL_FRAMES, np.nan, dtype=np.float32)
+        self._trail_x = np.concatenate([pad, self.traj['ship_x'][::step]])
+        self._trail_y = np.concatenate([pad, self.traj['ship_y'][::step]])
+        
+        # Animation, started whenever the view is shown
+        self._anim_spec = (self._update_overview, range(0, n, step), 30)
     
     def _draw_overview_info(self):
         """Draw educational info panel for overview."""
@@ -392,7 +820,7 @@ class MarsMissionSimulator:
         days = self.transfer.transfer_time / 86400
         dv1 = self.transfer.delta_v_departure / 1000
         dv2 = self.transfer.delta_v_arrival / 1000
-        phase = np.degrees(self.transfer.phase_angle)
+        phase = math.degrees(self.transfer.phase_angle)
         
         info = f"""
 ┌─────────────────────────────────────┐
@@ -447,43 +875,46 @@ the Sun's gravity the whole way!
         ax.text(0.02, 0.99, info, transform=ax.transAxes, color='#00ff88',
                 fontsize=10.5, fontfamily='monospace', va='top')
     
-    def _update_overview(self, frame):
-        """Update orbital animation."""
-        ex, ey = self.traj['earth_x'][frame], self.traj['earth_y'][frame]
-        mx, my = self.traj['mars_x'][frame], self.traj['mars_y'][frame]
-        sx, sy = self.traj['ship_x'][frame], self.traj['ship_y'][frame]
+    def _update_overview(self, i):
+        """Update orbital animation at trajectory sample i."""
+        # One packed row holds the sample (columns in TRAJ_KEYS order)
+        row = self._traj_rows[i]
+        ex, ey, mx, my = row[2:6].tolist()
         
-        self.earth_dot.set_data([ex], [ey])
-        self.mars_dot.set_data([mx], [my])
-        self.ship_dot.set_data([sx], [sy])
+        # Length-1 views into the row: no per-frame lists
+        self.earth_dot.set_data(row[2:3], row[3:4])
+        self.mars_dot.set_data(row[4:5], row[5:6])
+        self.ship_dot.set_data(row[6:7], row[7:8])
         
-        trail_start = max(0, frame - 80)
-        self.ship_trail.set_data(self.traj['ship_x'][trail_start:frame+1],
-                                  self.traj['ship_y'][trail_start:frame+1])
+        # The trail spans the last TRAIL_FRAMES animation frames
+        trail = slice(i // self._anim_step, i // self._anim_step + TRAIL_FRAMES + 1)
+        self.ship_trail.set_data(self._trail_x[trail], self._trail_y[trail])
         
         self.earth_lbl.set_position((ex, ey - 0.15))
         self.earth_lbl.set_text('EARTH')
         self.mars_lbl.set_position((mx, my + 0.18))
         self.mars_lbl.set_text('MARS')
         
-        day = self.traj['days'][frame]
-        vel = self.traj['ship_v'][frame]
-        dist = self.traj['ship_r'][frame]
-        progress = frame / len(self.traj['time']) * 100
-        total = self.traj['days'][-1]
-        
-        phase = "DEPARTURE" if progress < 5 else "ARRIVAL" if progress > 95 else "CRUISE"
+        self.status.set_text(self._status_texts[i // self._anim_step])
         
-        self.status.set_text(f"""╔═══════════════════════════╗
+        return (self.earth_dot, self.mars_dot, self.ship_dot, self.ship_trail,
+                self.earth_lbl, self.mars_lbl, self.status)
+    
+    def _status_text(self, i):
+        """Status panel text at trajectory sample i."""
+        _, day, *_, vel, dist = self._traj_rows[i].tolist()
+        progress = self._progress[i]
+        total = self._total_days
+        phase = self._phase[i]
+        
+        return f"""╔═══════════════════════════╗
 ║  MISSION DAY {day:>5.0f} / {total:.0f}  ║
 ╠═══════════════════════════╣
 ║  Progress:  {progress:>5.1f}%        ║
 ║  Velocity:  {vel:>5.1f} km/s     ║
 ║  Distance:  {dist:>5.2f} AU       ║
 ║  Phase:     {phase:<12}  ║
-╚═══════════════════════════╝""")
-        
-        return self.earth_dot, self.mars_dot, self.ship_dot
+╚═══════════════════════════╝"""
     
     # =========================================================================
     # VIEW 2: TRANSIT (Animated graphs with explanations)
@@ -501,8 +932,8 @@ the Sun's gravity the whole way!
         ax1.fill_between(days, 20, vel, alpha=0.25, color='#00ffff')
         ax1.plot(days, vel, color='#00ffff', lw=2.5, label='Spacecraft')
         
-        v_earth = np.sqrt(MU_SUN / R_EARTH_ORBIT) / 1000
-        v_mars = np.sqrt(MU_SUN / R_MARS_ORBIT) / 1000
+        v_earth = math.sqrt(MU_SUN / R_EARTH_ORBIT) / 1000
+        v_mars = math.sqrt(MU_SUN / R_MARS_ORBIT) / 1000
         ax1.axhline(v_earth, color='#4488ff', ls='--', lw=2, label=f'Earth: {v_earth:.1f} km/s')
         ax1.axhline(v_mars, color='#ff6644', ls='--', lw=2, label=f'Mars: {v_mars:.1f} km/s')
         
@@ -512,8 +943,9 @@ the Sun's gravity the whole way!
         ax1.set_ylim(20, 35)
         
         # Animated marker
-        self.vel_marker, = ax1.plot([], [], 'o', color='#ffffff', ms=12, mec='#00ffff', mew=2, zorder=20)
-        self.vel_text = ax1.text(0, 0, '', color='white', fontsize=10, fontweight='bold')
+        self.vel_marker, = ax1.plot([], [], 'o', color='#ffffff', ms=12, mec='#00ffff', mew=2, zorder=20,
+                                    animated=True)
+        self.vel_text = ax1.text(0, 0, '', color='white', fontsize=10, fontweight='bold', animated=True)
         
         # Distance plot
         ax2 = self.fig.add_axes([0.06, 0.12, 0.45, 0.36])
@@ -531,8 +963,9 @@ the Sun's gravity the whole way!
         ax2.set_ylim(0.9, 1.65)
         
         # Animated marker
-        self.dist_marker, = ax2.plot([], [], 'o', color='#ffffff', ms=12, mec='#ffaa00', mew=2, zorder=20)
-        self.dist_text = ax2.text(0, 0, '', color='white', fontsize=10, fontweight='bold')
+        self.dist_marker, = ax2.plot([], [], 'o', color='#ffffff', ms=12, mec='#ffaa00', mew=2, zorder=20,
+                                     animated=True)
+        self.dist_text = ax2.text(0, 0, '', color='white', fontsize=10, fontweight='bold', animated=True)
         
         # Educational info panel
         ax3 = self.fig.add_axes([0.54, 0.08, 0.44, 0.88])
@@ -596,27 +1029,30 @@ during critical events like landing!
         self.transit_ax1 = ax1
         self.transit_ax2 = ax2
         
-        # Start animation
-        self.transit_anim = animation.FuncAnimation(
-            self.fig, self._update_transit, frames=len(days),
-            interval=40, blit=False, repeat=True
-        )
-    
-    def _update_transit(self, frame):
-        """Update transit animation."""
-        day = self.traj['days'][frame]
-        vel = self.traj['ship_v'][frame]
-        dist = self.traj['ship_r'][frame]
+        # Value-label anchors sit at a fixed offset from each marker
+        self._label_day = days + 5
+        self._vel_label_y = vel + 0.5
+        self._dist_label_y = dist + 0.03
         
-        self.vel_marker.set_data([day], [vel])
-        self.vel_text.set_position((day + 5, vel + 0.5))
+        # Animation, started whenever the view is shown
+        self._anim_step = self._frame_step()
+        self._anim_spec = (self._update_transit, range(0, len(days), self._anim_step), 40)
+    
+    def _update_transit(self, i):
+        """Update transit animation at trajectory sample i."""
+        row = self._traj_rows[i]
+        vel, dist = row[8].item(), row[9].item()
+        day = row[1:2]
+        
+        self.vel_marker.set_data(day, row[8:9])
+        self.vel_text.set_position((self._label_day[i], self._vel_label_y[i]))
         self.vel_text.set_text(f'{vel:.1f} km/s')
         
-        self.dist_marker.set_data([day], [dist])
-        self.dist_text.set_position((day + 5, dist + 0.03))
+        self.dist_marker.set_data(day, row[9:10])
+        self.dist_text.set_position((self._label_day[i], self._dist_label_y[i]))
         self.dist_text.set_text(f'{dist:.2f} AU')
         
-        return self.vel_marker, self.dist_marker
+        return self.vel_marker, self.dist_marker, self.vel_text, self.dist_text
     
     # =========================================================================
     # VIEW 3: EDL (Entry, Descent, Landing with full explanations)
@@ -814,7 +1250,7 @@ SpaceX Starship
                    'Launch (days from Jan 1)', 'Arrival (days from Jan 1)')
         
         levels = np.linspace(5.5, 9, 8)
-        cp = ax.contourf(self.porkchop['X'], self.porkchop['Y'], 
+        cp = ax.contourf(self.porkchop['launch'], self.porkchop['arrival'], 
                          self.porkchop['Z'], levels=levels, cmap='RdYlGn_r', extend='max')
         
         cbar = self.fig.colorbar(cp, ax=ax, shrink=0.7, pad=0.02)
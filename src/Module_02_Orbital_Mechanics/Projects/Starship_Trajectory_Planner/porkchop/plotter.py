@@ -31,6 +31,9 @@ T_MARS = 686.98 * 24 * 3600
 W_EARTH = 2 * np.pi / T_EARTH
 W_MARS = 2 * np.pi / T_MARS
 
+# Earth-Mars Hohmann transfer time; both orbits are circular, so it is fixed
+T_HOHMANN = np.pi * np.sqrt(((R_EARTH + R_MARS) / 2)**3 / MU_SUN)
+
 def lambert_solver(r1_vec, r2_vec, dt):
     """
     Approximated Delta-V based on transfer geometry for the heatmap.
@@ -40,12 +43,8 @@ def lambert_solver(r1_vec, r2_vec, dt):
     r1 = np.linalg.norm(r1_vec)
     r2 = np.linalg.norm(r2_vec)
     
-    # Optimal Hohmann Time
-    a_hohmann = (r1 + r2) / 2
-    t_hohmann = np.pi * np.sqrt(a_hohmann**3 / MU_SUN)
-    
     # Heuristic penalty for non-optimal time
-    time_ratio = dt / t_hohmann
+    time_ratio = dt / T_HOHMANN
     
     # Base Hohmann dV ~ 5.7 km/s
     base_dv = 5700 
@@ -67,7 +66,7 @@ def plot_interactive_porkchop():
     arrival_days = np.linspace(100, 800, 100)
     
     X, Y = np.meshgrid(launch_days, arrival_days)
-    Z = np.zeros_like(X)
+    Z = np.empty(X.shape)  # every cell is written below (NaN when impossible)
     
     print("Generating Porkchop Plot (solving Lambert geometry)...")
     